@@ -7,6 +7,7 @@ without needing the MCP server running.
 from __future__ import annotations
 
 import json
+import os
 import subprocess
 import sys
 from pathlib import Path
@@ -119,14 +120,17 @@ def sync_changed(base_ref: str) -> None:
     engine = _build_engine(project_root)
     failures = 0
 
-    for rel_path in sorted(to_sync):
-        abs_path = str(project_root / rel_path)
-        sync_result = engine.sync_to_lark(local_path=abs_path, force=True)
-        if sync_result.success:
-            click.echo(f"  OK: {rel_path} -> {sync_result.document_id}")
-        else:
-            click.echo(f"  FAIL: {rel_path} — {sync_result.message}", err=True)
-            failures += 1
+    with engine.state_batch(str(project_root)):
+        for rel_path in sorted(to_sync):
+            abs_path = str(project_root / rel_path)
+            sync_result = engine.sync_to_lark(local_path=abs_path, force=True)
+            if sync_result.success:
+                click.echo(f"  OK: {rel_path} -> {sync_result.document_id}")
+            else:
+                click.echo(
+                    f"  FAIL: {rel_path} — {sync_result.message}", err=True
+                )
+                failures += 1
 
     if failures:
         click.echo(f"\n{failures} file(s) failed to sync.", err=True)
@@ -137,13 +141,16 @@ def sync_changed(base_ref: str) -> None:
 
 def _find_project_root(start: Path) -> Path | None:
     """Walk up from *start* to find a directory with .lark-sync.json."""
-    current = start.resolve()
-    if current.is_file():
-        current = current.parent
-    for parent in [current, *current.parents]:
-        if (parent / SyncEngine.PROJECT_STATE_FILENAME).exists():
-            return parent
-    return None
+    current = os.path.realpath(start)
+    if os.path.isfile(current):
+        current = os.path.dirname(current)
+    while True:
+        if os.path.exists(os.path.join(current, SyncEngine.PROJECT_STATE_FILENAME)):
+            return Path(current)
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
+        current = parent
 
 
 if __name__ == "__main__":
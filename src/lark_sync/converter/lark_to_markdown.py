@@ -14,6 +14,10 @@ from lark_sync.converter.block_types import BlockType
 from lark_sync.converter.text_elements import elements_to_markdown
 
 
+# Escapes pipes and flattens newlines so text fits in one table cell.
+_CELL_ESCAPE = str.maketrans({"|": "\\|", "\n": " "})
+
+
 def _children(block: dict[str, Any]) -> list[Any]:
     """Safely get children list, handling None values from the API."""
     return block.get("children") or []
@@ -337,7 +341,7 @@ class LarkToMarkdownConverter:
                             elements_to_markdown(body["elements"])
                         )
                         break
-        return " ".join(child_parts).replace("|", "\\|").replace("\n", " ")
+        return " ".join(child_parts).translate(_CELL_ESCAPE)
 
     # -- IMAGE -------------------------------------------------------------
 
@@ -22,6 +22,7 @@ sending the blocks to the Lark API.
 from __future__ import annotations
 
 import uuid
+from collections.abc import Iterator
 from typing import Any
 
 from markdown_it import MarkdownIt
@@ -48,12 +49,22 @@ class MarkdownToLarkConverter:
         quote children, table cells) are expressed through the ``children``
         key on the parent block.
         """
+        return list(self.iter_convert(markdown_text))
+
+    def iter_convert(self, markdown_text: str) -> Iterator[dict[str, Any]]:
+        """Like :meth:`convert`, but yield top-level blocks as they are built.
+
+        Lets callers start sending blocks to the API before the whole
+        document has been converted.
+        """
         tokens = self._md.parse(markdown_text)
-        blocks: list[dict[str, Any]] = []
+        pending: list[dict[str, Any]] = []
         idx = 0
         while idx < len(tokens):
-            idx = self._consume_token(tokens, idx, blocks, list_depth=0)
-        return blocks
+            idx = self._consume_token(tokens, idx, pending, list_depth=0)
+            if pending:
+                yield from pending
+                pending.clear()
 
     # ------------------------------------------------------------------
     # Token consumers
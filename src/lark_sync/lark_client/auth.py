@@ -8,10 +8,67 @@ configured from application settings.
 
 from __future__ import annotations
 
+import atexit
+import functools
+import http.cookiejar
+import logging
+import types
+
 import lark_oapi as lark
+import requests
+from requests.adapters import HTTPAdapter
 
 from lark_sync.config import settings
 
+logger = logging.getLogger(__name__)
+
+# Keep-alive connections held per host.  Covers the engine's worker pool
+# plus background jobs and tool threads without connections being
+# discarded (requests' default pool keeps only 10).
+_POOL_MAXSIZE = 16
+
+
+@functools.cache
+def _install_pooled_transport() -> None:
+    """Route lark-oapi's synchronous HTTP calls through one shared session.
+
+    The SDK (1.x) sends every request with ``requests.request`` from its
+    private ``lark_oapi.core.http.transport`` module, which opens a fresh
+    connection (TCP and TLS handshake) per API call.  Pointing that
+    module's ``requests`` name at a process-wide ``requests.Session``
+    lets consecutive calls reuse pooled keep-alive connections; the
+    session is closed at interpreter exit.
+
+    The one session is shared by every thread issuing API calls (the
+    engine's worker pool, background jobs, tool handlers).  Its cookie
+    jar rejects all cookies, so no state carries over between requests,
+    as with the SDK's own one-off ``requests.request`` calls;
+    authentication travels in request headers.
+
+    The patch is skipped, leaving the SDK untouched, if the transport
+    module cannot be imported or no longer has that layout.
+    """
+    try:
+        from lark_oapi.core.http import transport as sdk_transport
+    except ImportError:
+        logger.debug("lark-oapi transport not found; connection pooling off")
+        return
+    if getattr(sdk_transport, "requests", None) is not requests or not hasattr(
+        getattr(sdk_transport, "Transport", None), "execute"
+    ):
+        logger.debug("lark-oapi transport changed; connection pooling off")
+        return
+
+    session = requests.Session()
+    session.cookies.set_policy(
+        http.cookiejar.DefaultCookiePolicy(allowed_domains=[])
+    )
+    adapter = HTTPAdapter(pool_maxsize=_POOL_MAXSIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    atexit.register(session.close)
+    sdk_transport.requests = types.SimpleNamespace(request=session.request)
+
 
 def build_lark_client(
     *,
@@ -51,6 +108,7 @@ def build_lark_client(
             "Lark app_secret is required. Set LARK_APP_SECRET env var or pass app_secret explicitly."
         )
 
+    _install_pooled_transport()
     client = (
         lark.Client.builder()
         .app_id(resolved_app_id)
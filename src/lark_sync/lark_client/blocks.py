@@ -13,6 +13,7 @@ from __future__ import annotations
 import asyncio
 import time
 from collections import defaultdict
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -116,6 +117,12 @@ class BlocksClient:
     def __init__(self, client: lark.Client) -> None:
         self._client = client
         self.rate_limiter = WriteRateLimiter()
+        # Latest ``document_revision_id`` reported by a write response,
+        # keyed by document ID.
+        self._revisions: dict[str, int] = {}
+        # Documents written to since their revision was last forgotten
+        # whose latest write response carried no revision.
+        self._unknown_revisions: set[str] = set()
 
     # ------------------------------------------------------------------
     # List blocks (paginated)
@@ -164,25 +171,34 @@ class BlocksClient:
 
         return items, next_token
 
-    def list_all_blocks(self, document_id: str) -> list[Block]:
-        """Convenience: iterate all pages and return every block.
+    def iter_all_blocks(self, document_id: str) -> Iterator[Block]:
+        """Yield every block in the document, fetching pages lazily.
 
         Args:
             document_id: Target document.
 
-        Returns:
-            A flat list of all ``Block`` objects in the document.
+        Yields:
+            Each ``Block`` object, in API order.
         """
-        all_blocks: list[Block] = []
         page_token: str | None = None
         while True:
             blocks, page_token = self.list_blocks(
                 document_id, page_token=page_token
             )
-            all_blocks.extend(blocks)
+            yield from blocks
             if page_token is None:
                 break
-        return all_blocks
+
+    def list_all_blocks(self, document_id: str) -> list[Block]:
+        """Convenience: iterate all pages and return every block.
+
+        Args:
+            document_id: Target document.
+
+        Returns:
+            A flat list of all ``Block`` objects in the document.
+        """
+        return list(self.iter_all_blocks(document_id))
 
     # ------------------------------------------------------------------
     # Get single block
@@ -264,6 +280,7 @@ class BlocksClient:
         self._check_response(
             response, f"create children under {block_id} in {document_id}"
         )
+        self.record_revision(document_id, response)
 
         return response.data.children or []
 
@@ -305,6 +322,7 @@ class BlocksClient:
         self._check_response(
             response, f"update block {block_id} in {document_id}"
         )
+        self.record_revision(document_id, response)
 
     # ------------------------------------------------------------------
     # Batch delete children
@@ -354,6 +372,60 @@ class BlocksClient:
             f"batch delete children [{start_index}:{end_index}] "
             f"under {block_id} in {document_id}",
         )
+        self.record_revision(document_id, response)
+
+    # ------------------------------------------------------------------
+    # Revision tracking
+    # ------------------------------------------------------------------
+
+    def last_revision(self, document_id: str) -> int | None:
+        """Return the revision reported by the latest write to a document.
+
+        Args:
+            document_id: Target document.
+
+        Returns:
+            The ``document_revision_id`` from the most recent successful
+            write made through this client, or ``None`` if unknown.  Use
+            ``revision_unknown`` to tell "not written" from "written, but
+            the response carried no revision".
+        """
+        return self._revisions.get(document_id)
+
+    def revision_unknown(self, document_id: str) -> bool:
+        """Whether the latest write to a document reported no revision.
+
+        When ``True``, any revision known from before that write is
+        stale and the document metadata must be fetched instead.
+
+        Args:
+            document_id: Target document.
+        """
+        return document_id in self._unknown_revisions
+
+    def record_revision(self, document_id: str, response: Any) -> None:
+        """Remember the ``document_revision_id`` from a write response.
+
+        Also used for writes issued through the raw SDK client (e.g.
+        table patches) so the tracked revision stays current.
+
+        Args:
+            document_id: The document that was written to.
+            response: A successful Lark write response.
+        """
+        data = getattr(response, "data", None)
+        revision = getattr(data, "document_revision_id", None)
+        if revision is None:
+            self._revisions.pop(document_id, None)
+            self._unknown_revisions.add(document_id)
+        else:
+            self._revisions[document_id] = revision
+            self._unknown_revisions.discard(document_id)
+
+    def forget_revision(self, document_id: str) -> None:
+        """Discard the tracked revision for a document."""
+        self._revisions.pop(document_id, None)
+        self._unknown_revisions.discard(document_id)
 
     # ------------------------------------------------------------------
     # Helpers
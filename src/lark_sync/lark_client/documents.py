@@ -21,7 +21,7 @@ from lark_oapi.api.docx.v1 import (
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DocumentInfo:
     """Lightweight container for document metadata."""
 
@@ -48,7 +48,7 @@ def _initialize() -> None:
         md_to_lark_converter=md_to_lark,
     )
 
-    register_read_tools(mcp, client)
+    register_read_tools(mcp, client, engine)
     register_write_tools(mcp, client, engine)
     register_sync_tools(mcp, engine)
 
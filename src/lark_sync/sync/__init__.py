@@ -1,7 +1,7 @@
 """Sync engine package for bidirectional Lark <-> Markdown synchronization."""
 
 from lark_sync.sync.conflict import ConflictDetector, ConflictType
-from lark_sync.sync.differ import SyncDiffer
+from lark_sync.sync.differ import BlockEdit, SyncDiffer
 from lark_sync.sync.engine import SyncEngine, SyncResult, SyncStatusEntry, SyncStatusLabel
 from lark_sync.sync.state import (
     SyncDirection,
@@ -10,9 +10,11 @@ from lark_sync.sync.state import (
     SyncStateManager,
     compute_content_hash,
     compute_file_hash,
+    compute_file_hash_cached,
 )
 
 __all__ = [
+    "BlockEdit",
     "ConflictDetector",
     "ConflictType",
     "SyncDiffer",
@@ -26,4 +28,5 @@ __all__ = [
     "SyncStatusLabel",
     "compute_content_hash",
     "compute_file_hash",
+    "compute_file_hash_cached",
 ]
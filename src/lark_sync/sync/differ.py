@@ -8,9 +8,34 @@ for displaying what changed.
 from __future__ import annotations
 
 import difflib
+import hashlib
+import json
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
-from lark_sync.sync.state import SyncMapping, compute_file_hash
+from lark_sync.sync.state import SyncMapping, compute_file_hash_cached
+
+# ``json.dumps`` builds a new encoder per call whenever options are passed;
+# block hashing runs once per pushed block, so share a single instance.
+_CANONICAL_JSON = json.JSONEncoder(
+    sort_keys=True, separators=(",", ":"), ensure_ascii=False
+)
+
+
+@dataclass(frozen=True, slots=True)
+class BlockEdit:
+    """Replace top-level blocks ``old[old_start:old_end]`` with
+    ``new[new_start:new_end]``.
+
+    An empty old range is a pure insert; an empty new range is a pure
+    delete.
+    """
+
+    old_start: int
+    old_end: int
+    new_start: int
+    new_end: int
 
 
 class SyncDiffer:
@@ -44,7 +69,7 @@ class SyncDiffer:
             # No previous hash recorded -- consider it changed.
             return True
 
-        current_hash = compute_file_hash(mapping.local_path)
+        current_hash = compute_file_hash_cached(path, mapping)
         return current_hash != mapping.local_hash_at_sync
 
     @staticmethod
@@ -95,3 +120,39 @@ class SyncDiffer:
             lineterm="",
         )
         return "".join(diff)
+
+    @staticmethod
+    def block_hash(block: dict[str, Any]) -> str:
+        """Return a short content hash of a converter block and its subtree.
+
+        The block dict (including nested ``children``) is serialized to
+        canonical JSON, so two blocks hash equal exactly when they would
+        be created identically.
+        """
+        canonical = _CANONICAL_JSON.encode(block)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+    @staticmethod
+    def diff_blocks(
+        old_hashes: list[str], new_hashes: list[str]
+    ) -> list[BlockEdit]:
+        """Compute the top-level edits turning *old_hashes* into *new_hashes*.
+
+        Runs of equal subtree hashes are left alone; only the differing
+        ranges are returned, in document order.
+
+        Args:
+            old_hashes: Block hashes recorded at the last push.
+            new_hashes: Block hashes of the freshly converted document.
+
+        Returns:
+            A list of ``BlockEdit`` ranges.  Empty if nothing changed.
+        """
+        matcher = difflib.SequenceMatcher(
+            None, old_hashes, new_hashes, autojunk=False
+        )
+        return [
+            BlockEdit(i1, i2, j1, j2)
+            for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+            if tag != "equal"
+        ]
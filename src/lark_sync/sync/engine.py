@@ -7,13 +7,22 @@ updating the sync state.
 
 from __future__ import annotations
 
+import functools
 import logging
+import operator
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import AbstractContextManager, ExitStack
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import StrEnum
 from pathlib import Path
-from typing import Any
-
-from pydantic import BaseModel
+from typing import Any, TypeVar
 
 from lark_sync.sync.conflict import ConflictDetector, ConflictType
 from lark_sync.sync.differ import SyncDiffer
@@ -21,13 +30,13 @@ from lark_sync.sync.state import (
     SyncDirection,
     SyncMapping,
     SyncStateManager,
-    compute_file_hash,
+    compute_content_hash,
+    compute_file_hash_cached,
 )
 from lark_oapi.api.docx.v1 import (
     BatchUpdateDocumentBlockRequest,
     BatchUpdateDocumentBlockRequestBody,
     InsertTableRowRequest,
-    PatchDocumentBlockRequest,
     TextElement,
     TextRun,
     TextElementStyle,
@@ -42,6 +51,67 @@ from lark_sync.tools.read_tools import _block_to_dict
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+# Translation tables for deriving document titles / local filenames.
+_TITLE_SANITIZE = str.maketrans({" ": "-", "/": "-"})
+_STEM_HUMANIZE = str.maketrans({"-": " ", "_": " "})
+
+
+# Start directory -> Git root found for it.  Only hits are cached: a
+# directory outside any repository may become one later (``git init``),
+# and the server is long-lived.
+_git_root_cache: dict[str, Path] = {}
+_GIT_ROOT_CACHE_SIZE = 1024
+
+
+def _find_git_root_cached(start_dir: str) -> Path | None:
+    """Return the Git repository root containing *start_dir*, if any.
+
+    Works on plain strings with one ``stat`` per ancestor.  ``.git`` may
+    be a directory or, for worktrees and submodules, a file.
+    """
+    cached = _git_root_cache.get(start_dir)
+    if cached is not None:
+        return cached
+    current = start_dir
+    while True:
+        if os.path.exists(os.path.join(current, ".git")):
+            root = Path(current)
+            if len(_git_root_cache) >= _GIT_ROOT_CACHE_SIZE:
+                _git_root_cache.clear()
+            _git_root_cache[start_dir] = root
+            return root
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
+        current = parent
+
+
+def clear_git_root_cache() -> None:
+    """Forget all cached Git root lookups (e.g. between tests)."""
+    _git_root_cache.clear()
+
+
+def _sync_operation(method: Callable[..., _T]) -> Callable[..., _T]:
+    """Run a sync operation under the engine's operation lock.
+
+    Foreground calls and background jobs therefore never interleave
+    their writes to the same document or sync state.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self: SyncEngine, *args: Any, **kwargs: Any) -> _T:
+        with self.operation_lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+def _utcnow() -> datetime:
+    """Return the current UTC time as an aware ``datetime``."""
+    return datetime.fromtimestamp(time.time(), tz=timezone.utc)
+
 
 # ------------------------------------------------------------------
 # Result / Status models
@@ -58,7 +128,8 @@ class SyncStatusLabel(StrEnum):
     UNLINKED = "unlinked"
 
 
-class SyncResult(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class SyncResult:
     """Outcome of a single sync operation."""
 
     success: bool
@@ -69,8 +140,25 @@ class SyncResult(BaseModel):
     conflict: ConflictType = ConflictType.NONE
     diff_summary: str = ""
 
+    def to_dict(self) -> dict[str, Any]:
+        """Return the result as a plain dict (e.g. for MCP tool output).
+
+        Built field by field; ``dataclasses.asdict`` would deep-copy every
+        value for a flat record of immutable fields.
+        """
+        return {
+            "success": self.success,
+            "message": self.message,
+            "document_id": self.document_id,
+            "document_url": self.document_url,
+            "local_path": self.local_path,
+            "conflict": self.conflict,
+            "diff_summary": self.diff_summary,
+        }
 
-class SyncStatusEntry(BaseModel):
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class SyncStatusEntry:
     """Status snapshot for one tracked mapping."""
 
     local_path: str
@@ -79,6 +167,25 @@ class SyncStatusEntry(BaseModel):
     status: SyncStatusLabel
     last_synced: datetime | None = None
 
+    def to_dict(self) -> dict[str, Any]:
+        """Return the entry as a JSON-ready dict (e.g. for MCP tool output)."""
+        last_synced = self.last_synced
+        return {
+            "local_path": self.local_path,
+            "document_id": self.document_id,
+            "document_url": self.document_url,
+            "status": self.status.value,
+            "last_synced": last_synced.isoformat() if last_synced else None,
+        }
+
+
+_STATUS_MAP: dict[ConflictType, SyncStatusLabel] = {
+    ConflictType.NONE: SyncStatusLabel.IN_SYNC,
+    ConflictType.LOCAL_ONLY: SyncStatusLabel.LOCAL_AHEAD,
+    ConflictType.REMOTE_ONLY: SyncStatusLabel.REMOTE_AHEAD,
+    ConflictType.BOTH_CHANGED: SyncStatusLabel.CONFLICT,
+}
+
 
 # ------------------------------------------------------------------
 # Engine
@@ -101,6 +208,13 @@ class SyncEngine:
     """
 
     PROJECT_STATE_FILENAME = ".lark-sync.json"
+    # Upper bound on concurrent Lark API requests issued by the engine.
+    _MAX_WORKERS = 8
+    # Pulls a batch caller should keep prefetching ahead of the current
+    # operation; half the pool, leaving workers for pushes' own requests.
+    PREFETCH_WINDOW = _MAX_WORKERS // 2
+    # Seconds fetched document metadata stays fresh for status checks.
+    _STATUS_CACHE_TTL = 5.0
 
     def __init__(
         self,
@@ -116,6 +230,39 @@ class SyncEngine:
         self._conflict_detector = ConflictDetector()
         self._differ = SyncDiffer()
         self._project_states: dict[Path, SyncStateManager] = {}
+        # Document ID -> (monotonic fetch time, document metadata).
+        self._doc_info_cache: dict[str, tuple[float, Any]] = {}
+        # Document ID -> last known title; content writes never change it.
+        self._doc_titles: dict[str, str] = {}
+        # (document ID, revision) -> rendered Markdown, least recent first.
+        # Guarded by ``_md_cache_lock``: prefetch workers fill it while
+        # pulls read it.
+        self._md_cache: OrderedDict[tuple[str, int], str] = OrderedDict()
+        self._md_cache_lock = threading.Lock()
+        # Content hash -> converted top-level blocks, least recent first.
+        self._convert_cache: OrderedDict[str, list[dict[str, Any]]] = (
+            OrderedDict()
+        )
+        # Document ID -> state manager that last held its mapping.
+        self._doc_owners: dict[str, SyncStateManager] = {}
+        # Shared pool for overlapping independent, blocking Lark API calls.
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._MAX_WORKERS, thread_name_prefix="lark-sync"
+        )
+        # Held for the duration of each sync operation (see
+        # ``_sync_operation``) and by callers writing documents directly.
+        self.operation_lock = threading.RLock()
+        # Set when a block write under the current operation failed
+        # without raising (e.g. a logged batch-update failure), so the
+        # document may not match its block hashes.
+        self._partial_write = False
+        # Background jobs by ID, run one at a time on their own thread so
+        # they never occupy the shared pool.  ``_job_finished`` holds the
+        # monotonic time each finished job completed, for expiry.
+        self._jobs: dict[str, Future[Any]] = {}
+        self._job_finished: dict[str, float] = {}
+        self._jobs_lock = threading.Lock()
+        self._job_executor: ThreadPoolExecutor | None = None
 
     # ------------------------------------------------------------------
     # Project-local state detection
@@ -124,13 +271,10 @@ class SyncEngine:
     @staticmethod
     def _find_git_root(file_path: str) -> Path | None:
         """Walk up from *file_path* to find the Git repository root."""
-        current = Path(file_path).resolve()
-        if current.is_file():
-            current = current.parent
-        for parent in [current, *current.parents]:
-            if (parent / ".git").exists():
-                return parent
-        return None
+        current = os.path.realpath(file_path)
+        if os.path.isfile(current):
+            current = os.path.dirname(current)
+        return _find_git_root_cached(current)
 
     def _get_state_manager(self, local_path: str) -> SyncStateManager:
         """Return the appropriate state manager for *local_path*.
@@ -143,21 +287,33 @@ class SyncEngine:
         git_root = self._find_git_root(local_path)
         if git_root is None:
             return self._state
+        if git_root in self._project_states:
+            return self._project_states[git_root]
 
+        # Checked on every call: a state file may appear at any time
+        # (``init_project_sync``, ``git pull``, the CLI).
         project_state_file = git_root / self.PROJECT_STATE_FILENAME
         if not project_state_file.exists():
             return self._state
 
-        if git_root not in self._project_states:
-            self._project_states[git_root] = SyncStateManager(
-                str(project_state_file), project_root=git_root
-            )
+        self._project_states[git_root] = SyncStateManager(
+            str(project_state_file), project_root=git_root
+        )
         return self._project_states[git_root]
 
+    def state_batch(self, local_path: str) -> AbstractContextManager[None]:
+        """Defer sync-state writes for *local_path*'s state manager.
+
+        Use around bulk pushes or pulls so the state file is rewritten
+        once instead of after every file.
+        """
+        return self._get_state_manager(local_path).batch()
+
     # ------------------------------------------------------------------
     # Push: local Markdown -> Lark
     # ------------------------------------------------------------------
 
+    @_sync_operation
     def sync_to_lark(
         self,
         local_path: str,
@@ -165,33 +321,100 @@ class SyncEngine:
         folder_token: str | None = None,
         wiki_space_id: str | None = None,
         force: bool = False,
+        skip_if_unchanged: bool = True,
     ) -> SyncResult:
         """Push a local Markdown file to a Lark document.
 
-        If ``document_id`` is provided the existing document is updated
-        (all child blocks are cleared and recreated).  Otherwise a new
-        document is created in the specified ``folder_token``.
+        If ``document_id`` is provided the existing document is updated.
+        When the remote is unchanged since the last push, only the
+        top-level blocks that differ are rewritten; otherwise all child
+        blocks are cleared and recreated.  Without a ``document_id`` a
+        new document is created in the specified ``folder_token``.
+
+        When ``skip_if_unchanged`` is set, the file is byte-identical to
+        what was last synced to the same document and that document is
+        still at the revision last synced, the push is skipped (unless
+        ``force`` is set).  A document edited in Lark is overwritten as
+        usual.
         """
         path = Path(local_path)
-        if not path.exists():
+        try:
+            st = path.stat()
+        except FileNotFoundError:
             return SyncResult(
                 success=False,
                 message=f"Local file not found: {local_path}",
                 local_path=local_path,
             )
 
-        markdown_content = path.read_text(encoding="utf-8")
         state_mgr = self._get_state_manager(local_path)
         mapping = state_mgr.get_mapping(local_path)
 
         if document_id is None and mapping is not None:
             document_id = mapping.lark_document_id
 
-        # Conflict detection
+        # Start the conflict-check metadata fetch so it overlaps the
+        # local file checks and read.
+        doc_future: Future[Any] | None = None
         if not force and mapping is not None and document_id is not None:
+            doc_future = self._executor.submit(
+                self._get_doc_info, document_id, 0.0
+            )
+
+        may_skip = (
+            skip_if_unchanged
+            and doc_future is not None
+            and document_id == mapping.lark_document_id
+        )
+
+        def remote_unchanged_since_sync() -> bool:
+            """Whether the remote is still at the last synced revision."""
             try:
-                doc_info = self._client.documents.get(document_id)
+                revision = doc_future.result().revision_id
+            except Exception:
+                return False
+            return revision == mapping.remote_revision_at_sync
+
+        # An unchanged mtime and size since the last sync means the file
+        # has not been touched; skip without reading it.
+        if (
+            may_skip
+            and (st.st_mtime_ns, st.st_size)
+            == (mapping.local_mtime_ns, mapping.local_size)
+            and remote_unchanged_since_sync()
+        ):
+            return self._skipped_push(mapping, local_path)
+
+        # Read the file once; the sync-state hash is computed from the
+        # same bytes rather than re-reading the file after the push.
+        markdown_content = path.read_bytes().decode("utf-8")
+        current_hash = compute_content_hash(markdown_content)
+
+        if (
+            may_skip
+            and current_hash == mapping.local_hash_at_sync
+            and remote_unchanged_since_sync()
+        ):
+            # The file was touched but not changed; record its new
+            # fingerprint so the next check needs only a stat.
+            state_mgr.update_mapping(
+                local_path,
+                local_mtime_ns=st.st_mtime_ns,
+                local_size=st.st_size,
+            )
+            return self._skipped_push(mapping, local_path)
+
+        # Conflict detection
+        remote_unchanged = False
+        known_revision: int | None = None
+        if doc_future is not None:
+            try:
+                doc_info = doc_future.result()
                 current_revision: int = doc_info.revision_id
+                known_revision = current_revision
+                remote_unchanged = (
+                    current_revision == mapping.remote_revision_at_sync
+                )
                 conflict = self._conflict_detector.detect(mapping, current_revision)
                 if conflict == ConflictType.BOTH_CHANGED:
                     return SyncResult(
@@ -207,35 +430,64 @@ class SyncEngine:
             except Exception as exc:
                 logger.warning("Failed conflict check: %s", exc)
 
-        # Convert Markdown -> Lark blocks
-        lark_blocks = self._to_lark.convert(markdown_content)
+        # Convert in full before the remote document is touched, so a
+        # converter error leaves it (or its absence) as it was.
+        lark_blocks = self._convert_cached(current_hash, markdown_content)
+        block_hashes = [self._differ.block_hash(b) for b in lark_blocks]
 
-        # Create or update the remote document
+        # Create or update the remote document.
         document_url = ""
 
         if document_id is not None:
-            self._clear_document_blocks(document_id)
-            if lark_blocks:
+            self._client.blocks.forget_revision(document_id)
+        self._partial_write = False
+
+        if (
+            remote_unchanged
+            and mapping is not None
+            and mapping.block_hashes
+            and document_id == mapping.lark_document_id
+        ):
+            # The remote still holds exactly what the last push created,
+            # so only the top-level blocks that changed are rewritten.
+            if not self._apply_block_diff(
+                document_id, mapping.block_hashes, lark_blocks, block_hashes
+            ):
+                self._clear_document_blocks(document_id)
                 self._create_blocks_with_nesting(
                     document_id, document_id, lark_blocks
                 )
-            doc_info = self._client.documents.get(document_id)
-            new_revision: int = doc_info.revision_id
         else:
-            title = path.stem.replace("-", " ").replace("_", " ").title()
-            doc_response = self._client.documents.create(title, folder_token)
-            document_id = doc_response.document_id
-            if lark_blocks:
-                self._create_blocks_with_nesting(
-                    document_id, document_id, lark_blocks
-                )
-            doc_info = self._client.documents.get(document_id)
-            new_revision = doc_info.revision_id
-            document_url = ""
+            # Full rewrite.
+            if document_id is not None:
+                self._clear_document_blocks(document_id)
+            else:
+                title = path.stem.translate(_STEM_HUMANIZE).title()
+                doc_response = self._client.documents.create(title, folder_token)
+                document_id = doc_response.document_id
+                self._doc_titles[document_id] = doc_response.title
+                known_revision = doc_response.revision_id
+
+            self._create_blocks_with_nesting(document_id, document_id, lark_blocks)
+
+        partial_write = self._partial_write
+        if partial_write:
+            # Record no local fingerprint or block hashes: the file then
+            # counts as changed and the next push does a full rewrite,
+            # repairing whatever this one failed to write.
+            logger.warning(
+                "Incomplete write to %s; next push will rewrite it", document_id
+            )
+            block_hashes = []
+            synced_hash, synced_mtime_ns, synced_size = "", 0, 0
+        else:
+            synced_hash = current_hash
+            synced_mtime_ns, synced_size = st.st_mtime_ns, st.st_size
+
+        new_revision = self._read_revision(document_id, known_revision)
 
         # Update sync state
-        now = datetime.now(timezone.utc)
-        current_hash = compute_file_hash(local_path)
+        now = _utcnow()
 
         if mapping is not None:
             state_mgr.update_mapping(
@@ -244,8 +496,11 @@ class SyncEngine:
                 lark_document_url=document_url or mapping.lark_document_url,
                 lark_wiki_space_id=wiki_space_id or mapping.lark_wiki_space_id,
                 last_synced_at=now,
-                local_hash_at_sync=current_hash,
+                local_hash_at_sync=synced_hash,
                 remote_revision_at_sync=new_revision,
+                block_hashes=block_hashes,
+                local_mtime_ns=synced_mtime_ns,
+                local_size=synced_size,
             )
         else:
             new_mapping = SyncMapping(
@@ -254,17 +509,33 @@ class SyncEngine:
                 lark_document_url=document_url,
                 lark_wiki_space_id=wiki_space_id,
                 last_synced_at=now,
-                local_hash_at_sync=current_hash,
+                local_hash_at_sync=synced_hash,
                 remote_revision_at_sync=new_revision,
+                block_hashes=block_hashes,
+                local_mtime_ns=synced_mtime_ns,
+                local_size=synced_size,
                 sync_direction=SyncDirection.TO_LARK,
             )
             state_mgr.add_mapping(new_mapping)
+            self._doc_owners[document_id] = state_mgr
 
+        self.invalidate_status_cache(document_id)
         logger.info(
             "Synced local file %s -> Lark document %s (rev %d)",
             local_path, document_id, new_revision,
         )
 
+        if partial_write:
+            return SyncResult(
+                success=False,
+                message=(
+                    f"Partially synced to Lark document {document_id}: some "
+                    "blocks failed to write. Push again to rewrite it."
+                ),
+                document_id=document_id,
+                document_url=document_url,
+                local_path=local_path,
+            )
         return SyncResult(
             success=True,
             message=f"Successfully synced to Lark document {document_id}",
@@ -282,25 +553,40 @@ class SyncEngine:
     ) -> tuple[SyncMapping | None, SyncStateManager]:
         """Search all known state managers for a mapping by document ID.
 
-        Returns the mapping and the state manager that owns it.  The global
-        state is checked first, then any cached project-local states.
+        Returns the mapping and the state manager that owns it.  The
+        manager that last owned the document is tried first; otherwise the
+        global state is checked, then any cached project-local states.
         """
-        mapping = self._state.get_mapping_by_doc_id(document_id)
-        if mapping is not None:
-            return mapping, self._state
-        for mgr in self._project_states.values():
+        owner = self._doc_owners.get(document_id)
+        if owner is not None:
+            mapping = owner.get_mapping_by_doc_id(document_id)
+            if mapping is not None:
+                return mapping, owner
+
+        for mgr in [self._state, *self._project_states.values()]:
             mapping = mgr.get_mapping_by_doc_id(document_id)
             if mapping is not None:
+                self._doc_owners[document_id] = mgr
                 return mapping, mgr
         return None, self._state
 
+    @_sync_operation
     def sync_from_lark(
         self,
         document_id: str,
         local_path: str | None = None,
         force: bool = False,
+        compute_diff_summary: bool = True,
+        prefetched: tuple[int, str] | None = None,
     ) -> SyncResult:
-        """Pull a Lark document and write it as a local Markdown file."""
+        """Pull a Lark document and write it as a local Markdown file.
+
+        Pass ``compute_diff_summary=False`` to skip building the unified
+        diff against the previous local content (e.g. for batch pulls
+        that never show it).  *prefetched* is a ``(revision, markdown)``
+        pair returned by a ``prefetch_pulls`` future; it is used instead
+        of fetching blocks when the revision is still current.
+        """
         mapping, state_mgr = self._find_mapping_by_doc_id(document_id)
 
         if local_path is None and mapping is not None:
@@ -309,10 +595,19 @@ class SyncEngine:
             if state_mgr.project_root and not Path(local_path).is_absolute():
                 local_path = state_mgr.resolve_path(local_path)
 
-        # Fetch remote document metadata
+        # Fetch remote document metadata.  When there is no conflict check
+        # that could abort the pull, fetch the blocks concurrently.
+        blocks_future: Future[list[dict[str, Any]]] | None = None
+        if (force or mapping is None) and prefetched is None:
+            blocks_future = self._executor.submit(
+                self._fetch_block_dicts, document_id
+            )
+
         try:
-            doc_info = self._client.documents.get(document_id)
+            doc_info = self._get_doc_info(document_id, max_age_s=0.0)
         except Exception as exc:
+            if blocks_future is not None:
+                blocks_future.cancel()
             return SyncResult(
                 success=False,
                 message=f"Failed to fetch document {document_id}: {exc}",
@@ -325,11 +620,7 @@ class SyncEngine:
         document_url: str = ""
 
         if local_path is None:
-            safe_name = (
-                document_title.lower()
-                .replace(" ", "-")
-                .replace("/", "-")
-            )
+            safe_name = document_title.lower().translate(_TITLE_SANITIZE)
             local_path = f"{safe_name}.md"
 
         # Conflict detection
@@ -347,35 +638,88 @@ class SyncEngine:
                     conflict=conflict,
                 )
 
-        # Fetch blocks and convert to Markdown
-        try:
-            raw_blocks = self._client.blocks.list_all_blocks(document_id)
-            blocks = [_block_to_dict(b) for b in raw_blocks]
-        except Exception as exc:
+        # Nothing to pull when the remote revision and the local file both
+        # still match the last sync.
+        if (
+            not force
+            and mapping is not None
+            and current_revision == mapping.remote_revision_at_sync
+            and state_mgr.get_mapping(local_path) is mapping
+            and self._local_file_matches(local_path, mapping)
+        ):
             return SyncResult(
-                success=False,
-                message=f"Failed to fetch blocks for {document_id}: {exc}",
+                success=True,
+                message="Already in sync; skipped pull",
                 document_id=document_id,
+                document_url=mapping.lark_document_url,
                 local_path=local_path,
             )
 
-        markdown_content = self._to_md.convert(blocks)
+        # A revision already rendered needs no block fetch at all.
+        if prefetched is not None and prefetched[0] == current_revision:
+            markdown_content: str | None = prefetched[1]
+        else:
+            markdown_content = self._cached_markdown(
+                document_id, current_revision
+            )
+        if markdown_content is not None:
+            if blocks_future is not None:
+                blocks_future.cancel()
+        elif blocks_future is None:
+            blocks_future = self._executor.submit(
+                self._fetch_block_dicts, document_id
+            )
 
-        # Compute diff summary if we have previous local content.
-        diff_summary = ""
+        # Read the previous local content while the block fetch (and its
+        # conversion to plain dicts) is in flight.
         path = Path(local_path)
-        if path.exists():
-            old_content = path.read_text(encoding="utf-8")
-            diff_summary = self._differ.compute_diff(old_content, markdown_content)
+        try:
+            old_content: bytes | None = path.read_bytes()
+        except FileNotFoundError:
+            old_content = None
+
+        # Fetch blocks and convert to Markdown
+        if markdown_content is None:
+            try:
+                blocks = blocks_future.result()
+            except Exception as exc:
+                return SyncResult(
+                    success=False,
+                    message=f"Failed to fetch blocks for {document_id}: {exc}",
+                    document_id=document_id,
+                    local_path=local_path,
+                )
+            markdown_content = self._to_md.convert(blocks)
+            self._cache_markdown(document_id, current_revision, markdown_content)
 
-        # Write to local file
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(markdown_content, encoding="utf-8")
+        new_content = markdown_content.encode("utf-8")
+        current_hash = compute_content_hash(markdown_content)
+
+        # Compute diff summary only if the previous local content differs.
+        diff_summary = ""
+        if (
+            compute_diff_summary
+            and old_content is not None
+            and old_content != new_content
+        ):
+            old_text = old_content.decode("utf-8")
+            if compute_content_hash(old_text) != current_hash:
+                diff_summary = self._differ.compute_diff(
+                    old_text, markdown_content
+                )
+
+        # Write to local file, creating parent directories only if needed.
+        if old_content != new_content:
+            try:
+                path.write_text(markdown_content, encoding="utf-8")
+            except FileNotFoundError:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text(markdown_content, encoding="utf-8")
 
         # Update sync state — use the state manager that owns the mapping,
         # or resolve one from the local_path for new mappings.
-        now = datetime.now(timezone.utc)
-        current_hash = compute_file_hash(local_path)
+        now = _utcnow()
+        st = path.stat()
 
         if mapping is not None:
             state_mgr.update_mapping(
@@ -384,6 +728,9 @@ class SyncEngine:
                 last_synced_at=now,
                 local_hash_at_sync=current_hash,
                 remote_revision_at_sync=current_revision,
+                block_hashes=[],
+                local_mtime_ns=st.st_mtime_ns,
+                local_size=st.st_size,
             )
         else:
             # For new mappings, pick the right state manager from the local path.
@@ -395,10 +742,14 @@ class SyncEngine:
                 last_synced_at=now,
                 local_hash_at_sync=current_hash,
                 remote_revision_at_sync=current_revision,
+                local_mtime_ns=st.st_mtime_ns,
+                local_size=st.st_size,
                 sync_direction=SyncDirection.FROM_LARK,
             )
             state_mgr.add_mapping(new_mapping)
+            self._doc_owners[document_id] = state_mgr
 
+        self.invalidate_status_cache(document_id)
         logger.info(
             "Synced Lark document %s -> local file %s (rev %d)",
             document_id, local_path, current_revision,
@@ -413,6 +764,197 @@ class SyncEngine:
             diff_summary=diff_summary,
         )
 
+    def read_markdown(self, document_id: str) -> str:
+        """Return a Lark document's current content as Markdown.
+
+        The rendered Markdown is cached per document revision, so reading
+        an unchanged document costs one metadata request.
+        """
+        revision = self._get_doc_info(document_id, max_age_s=0.0).revision_id
+        markdown_content = self._cached_markdown(document_id, revision)
+        if markdown_content is None:
+            blocks = self._fetch_block_dicts(document_id)
+            markdown_content = self._to_md.convert(blocks)
+            self._cache_markdown(document_id, revision, markdown_content)
+        return markdown_content
+
+    def sync_all_from_lark(
+        self, document_ids: list[str], force: bool = False
+    ) -> list[SyncResult]:
+        """Pull several Lark documents, overlapping their remote fetches.
+
+        Each document's metadata and blocks are fetched and rendered
+        concurrently on the engine's thread pool; the pulls themselves
+        (conflict checks, local writes, state updates) then run one at a
+        time in order, reusing the rendered Markdown.  State files are
+        written once at the end.
+
+        Returns:
+            One ``SyncResult`` per document, in the order given.
+        """
+        results: list[SyncResult] = []
+        with self.all_states_batch():
+            prefetches = self.prefetch_pulls(document_ids, force=force)
+            for doc_id, prefetch in zip(document_ids, prefetches):
+                results.append(
+                    self.sync_from_lark(
+                        doc_id,
+                        force=force,
+                        compute_diff_summary=False,
+                        prefetched=self.prefetch_result(prefetch),
+                    )
+                )
+        return results
+
+    def prefetch_pulls(
+        self, document_ids: list[str], force: bool = False
+    ) -> list[Future[tuple[int, str] | None]]:
+        """Start rendering documents that are about to be pulled.
+
+        Returns one future per document, resolving to the rendered
+        ``(revision, markdown)`` (or ``None`` when the pull will not need
+        blocks).  Pass it to ``sync_from_lark`` via ``prefetch_result``;
+        the Markdown travels with the future, so it cannot be evicted
+        from the cache before the pull runs.  Fetch errors are left on
+        the futures, since the pull itself will report them.
+
+        Mappings are looked up here, under ``operation_lock``; the pool
+        workers only receive each document's expected revision.
+        """
+        with self.operation_lock:
+            expected: list[int | None] = []
+            for doc_id in document_ids:
+                mapping, _ = self._find_mapping_by_doc_id(doc_id)
+                expected.append(
+                    None
+                    if force or mapping is None
+                    else mapping.remote_revision_at_sync
+                )
+        return [
+            self._executor.submit(self._prefetch_markdown, doc_id, revision)
+            for doc_id, revision in zip(document_ids, expected)
+        ]
+
+    def all_states_batch(self) -> ExitStack:
+        """Defer sync-state writes for every known state manager.
+
+        The global and all cached project-local state files are each
+        written at most once, when the returned context exits.
+        """
+        stack = ExitStack()
+        for mgr in [self._state, *self._project_states.values()]:
+            stack.enter_context(mgr.batch())
+        return stack
+
+    @staticmethod
+    def prefetch_result(
+        prefetch: Future[tuple[int, str] | None],
+    ) -> tuple[int, str] | None:
+        """Wait for a ``prefetch_pulls`` future and return its Markdown.
+
+        Returns ``None`` if the prefetch failed; the pull then fetches
+        (and reports errors) itself.
+        """
+        if prefetch.exception() is not None:
+            return None
+        return prefetch.result()
+
+    def _prefetch_markdown(
+        self, document_id: str, synced_revision: int | None
+    ) -> tuple[int, str] | None:
+        """Render a document ahead of a pull.
+
+        Documents whose remote revision still equals *synced_revision* are
+        skipped, since the pull will not need their blocks.  Runs on a
+        pool thread, so it must not touch sync state.
+        """
+        revision = self._get_doc_info(document_id, max_age_s=0.0).revision_id
+        if synced_revision is not None and revision == synced_revision:
+            return None
+        markdown_content = self._cached_markdown(document_id, revision)
+        if markdown_content is None:
+            blocks = self._fetch_block_dicts(document_id)
+            markdown_content = self._to_md.convert(blocks)
+            self._cache_markdown(document_id, revision, markdown_content)
+        return revision, markdown_content
+
+    # ------------------------------------------------------------------
+    # Background jobs
+    # ------------------------------------------------------------------
+
+    # Seconds a finished job's outcome is kept for ``job_status``.
+    _JOB_TTL = 3600.0
+
+    def submit_job(
+        self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any
+    ) -> str:
+        """Run ``fn(*args, **kwargs)`` in the background.
+
+        Returns:
+            A job ID to pass to ``job_status``.
+        """
+        if self._job_executor is None:
+            self._job_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="lark-sync-job"
+            )
+        job_id = uuid.uuid4().hex
+        future = self._job_executor.submit(fn, *args, **kwargs)
+        with self._jobs_lock:
+            self._expire_jobs()
+            self._jobs[job_id] = future
+        future.add_done_callback(
+            lambda _: self._mark_job_finished(job_id)
+        )
+        return job_id
+
+    def _mark_job_finished(self, job_id: str) -> None:
+        with self._jobs_lock:
+            if job_id in self._jobs:
+                self._job_finished[job_id] = time.monotonic()
+
+    def _expire_jobs(self) -> None:
+        """Forget jobs that finished over ``_JOB_TTL`` seconds ago.
+
+        Outcomes nobody polled would otherwise be kept for the life of
+        the server.  The caller holds ``_jobs_lock``.
+        """
+        cutoff = time.monotonic() - self._JOB_TTL
+        expired = [
+            job_id
+            for job_id, finished in self._job_finished.items()
+            if finished < cutoff
+        ]
+        for job_id in expired:
+            del self._job_finished[job_id]
+            del self._jobs[job_id]
+
+    def job_status(self, job_id: str) -> dict[str, Any]:
+        """Report a background job's state and, once finished, its outcome.
+
+        A finished job is forgotten after its outcome has been reported,
+        or once it has gone unpolled for ``_JOB_TTL`` seconds.
+
+        Returns:
+            A dict with ``job_id`` and ``status`` (``pending``,
+            ``running``, ``done``, ``failed`` or ``unknown``), plus
+            ``result`` when done or ``message`` when failed.
+        """
+        with self._jobs_lock:
+            self._expire_jobs()
+            future = self._jobs.get(job_id)
+            if future is None:
+                return {"job_id": job_id, "status": "unknown"}
+            if not future.done():
+                status = "running" if future.running() else "pending"
+                return {"job_id": job_id, "status": status}
+            del self._jobs[job_id]
+            self._job_finished.pop(job_id, None)
+
+        exc = future.exception()
+        if exc is not None:
+            return {"job_id": job_id, "status": "failed", "message": str(exc)}
+        return {"job_id": job_id, "status": "done", "result": future.result()}
+
     # ------------------------------------------------------------------
     # Status
     # ------------------------------------------------------------------
@@ -428,27 +970,33 @@ class SyncEngine:
         """
         if local_path is not None:
             state_mgr = self._get_state_manager(local_path)
-            state = state_mgr.load()
-            mappings = [
-                m for m in state.mappings
-                if m.local_path == local_path
-                or m.local_path == state_mgr._normalize_path(local_path)
-            ]
+            state_mgr.load(validate=False)
+            mapping = state_mgr.get_mapping(local_path)
+            mappings = [mapping] if mapping is not None else []
         else:
             # Gather mappings from all known state managers.
             mappings: list[SyncMapping] = []
             seen_doc_ids: set[str] = set()
             for mgr in [self._state, *self._project_states.values()]:
-                state = mgr.load()
+                state = mgr.load(validate=False)
                 for m in state.mappings:
                     if m.lark_document_id not in seen_doc_ids:
                         mappings.append(m)
                         seen_doc_ids.add(m.lark_document_id)
 
+        # Remote revision lookups are independent, so issue them
+        # concurrently; statuses are then computed on this thread.  A
+        # single lookup is made inline rather than handed to the pool.
+        doc_ids = [m.lark_document_id for m in mappings]
+        if len(doc_ids) > 1:
+            revisions = self._executor.map(self._fetch_revision, doc_ids)
+        else:
+            revisions = map(self._fetch_revision, doc_ids)
+
         entries: list[SyncStatusEntry] = []
 
-        for mapping in mappings:
-            status = self._compute_status(mapping)
+        for mapping, revision in zip(mappings, revisions):
+            status = self._compute_status(mapping, revision)
             entries.append(
                 SyncStatusEntry(
                     local_path=mapping.local_path,
@@ -461,34 +1009,215 @@ class SyncEngine:
 
         return entries
 
+    def get_cached_title(self, document_id: str) -> str | None:
+        """Return the last title seen for a document, without a fetch.
+
+        Titles are recorded whenever this engine fetches a document's
+        metadata or creates a document.
+
+        Args:
+            document_id: The Lark document ID.
+
+        Returns:
+            The title, or ``None`` if the document has not been seen.
+        """
+        return self._doc_titles.get(document_id)
+
+    def record_title(self, document_id: str, title: str) -> None:
+        """Remember a document's title, e.g. one returned on creation."""
+        self._doc_titles[document_id] = title
+
+    def prefetch_title(self, document_id: str) -> Future[Any] | None:
+        """Start fetching a document's title unless it is already known.
+
+        The fetch runs on the engine's thread pool; once the returned
+        future is done, ``get_cached_title`` has the title.
+
+        Returns:
+            The metadata fetch's future, or ``None`` if the title is
+            already cached.
+        """
+        if document_id in self._doc_titles:
+            return None
+        return self._executor.submit(self._get_doc_info, document_id, 0.0)
+
+    @_sync_operation
+    def replace_document_content(
+        self,
+        document_id: str,
+        blocks: list[dict[str, Any]],
+        clear: bool = True,
+    ) -> None:
+        """Replace a document's content with converted Lark blocks.
+
+        Sync mappings are left untouched.  Pass ``clear=False`` for a
+        newly created document, which has nothing to delete.
+
+        Args:
+            document_id: The document to write.
+            blocks: Blocks from ``MarkdownToLarkConverter.convert``.
+            clear: Whether to delete the existing content first.
+        """
+        if clear:
+            self._clear_document_blocks(document_id)
+        if blocks:
+            self._create_blocks_with_nesting(document_id, document_id, blocks)
+        self.invalidate_status_cache(document_id)
+
     # ------------------------------------------------------------------
     # Private helpers
     # ------------------------------------------------------------------
 
-    def _compute_status(self, mapping: SyncMapping) -> SyncStatusLabel:
-        """Determine the current sync status label for a mapping."""
+    @staticmethod
+    def _local_file_matches(local_path: str, mapping: SyncMapping) -> bool:
+        """Whether *local_path* still has the content last synced."""
+        try:
+            current_hash = compute_file_hash_cached(local_path, mapping)
+        except FileNotFoundError:
+            return False
+        return current_hash == mapping.local_hash_at_sync
+
+    @staticmethod
+    def _skipped_push(mapping: SyncMapping, local_path: str) -> SyncResult:
+        """Result for a push skipped because neither side changed."""
+        return SyncResult(
+            success=True,
+            message="No local or remote changes since last sync; skipped push",
+            document_id=mapping.lark_document_id,
+            document_url=mapping.lark_document_url,
+            local_path=local_path,
+        )
+
+    def _read_revision(
+        self, document_id: str, known_revision: int | None = None
+    ) -> int:
+        """Return the current revision of a document after writing to it.
+
+        Uses the revision reported by the last write response when
+        available.  When nothing was written, *known_revision* (the
+        revision already fetched for the conflict check or returned by
+        document creation) is still current.  The document metadata is
+        fetched otherwise, including when a write's response carried no
+        revision (so *known_revision* predates it).
+        """
+        blocks = self._client.blocks
+        revision = blocks.last_revision(document_id)
+        if revision is not None:
+            return revision
+        if known_revision is not None and not blocks.revision_unknown(
+            document_id
+        ):
+            return known_revision
+        return self._get_doc_info(document_id, max_age_s=0.0).revision_id
+
+    def _get_doc_info(
+        self, document_id: str, max_age_s: float = _STATUS_CACHE_TTL
+    ) -> Any:
+        """Return document metadata, reusing a fetch younger than *max_age_s*.
+
+        Pass ``max_age_s=0`` to always fetch (e.g. for conflict checks);
+        the fresh result still refreshes the cache for later lookups.
+
+        Raises:
+            Exception: Whatever ``documents.get`` raises on failure.
+        """
+        now = time.monotonic()
+        cached = self._doc_info_cache.get(document_id)
+        if cached is not None and now - cached[0] < max_age_s:
+            return cached[1]
+        doc_info = self._client.documents.get(document_id)
+        self._doc_info_cache[document_id] = (now, doc_info)
+        if doc_info.title:
+            self._doc_titles[document_id] = doc_info.title
+        return doc_info
+
+    def _fetch_revision(self, document_id: str) -> int | None:
+        """Return a document's current revision, or ``None`` on failure.
+
+        Metadata is cached for ``_STATUS_CACHE_TTL`` seconds so that
+        rapid successive status checks skip the round trip.
+        """
         try:
-            doc_info = self._client.documents.get(mapping.lark_document_id)
-            current_revision: int = doc_info.revision_id
+            return self._get_doc_info(document_id).revision_id
         except Exception:
-            return SyncStatusLabel.UNLINKED
+            return None
 
-        conflict = self._conflict_detector.detect(mapping, current_revision)
+    def invalidate_status_cache(self, document_id: str | None = None) -> None:
+        """Drop cached document metadata used by ``get_sync_status``.
 
-        status_map: dict[ConflictType, SyncStatusLabel] = {
-            ConflictType.NONE: SyncStatusLabel.IN_SYNC,
-            ConflictType.LOCAL_ONLY: SyncStatusLabel.LOCAL_AHEAD,
-            ConflictType.REMOTE_ONLY: SyncStatusLabel.REMOTE_AHEAD,
-            ConflictType.BOTH_CHANGED: SyncStatusLabel.CONFLICT,
-        }
+        Args:
+            document_id: The document to forget, or ``None`` for all.
+        """
+        if document_id is None:
+            self._doc_info_cache.clear()
+        else:
+            self._doc_info_cache.pop(document_id, None)
 
-        return status_map.get(conflict, SyncStatusLabel.UNLINKED)
+    def _compute_status(
+        self, mapping: SyncMapping, current_revision: int | None
+    ) -> SyncStatusLabel:
+        """Determine the current sync status label for a mapping.
+
+        *current_revision* is the remote revision fetched for the
+        mapping's document, or ``None`` if it could not be fetched.
+        """
+        if current_revision is None:
+            return SyncStatusLabel.UNLINKED
+
+        conflict = self._conflict_detector.detect(mapping, current_revision)
+        return _STATUS_MAP.get(conflict, SyncStatusLabel.UNLINKED)
+
+    # Number of rendered document revisions kept by ``_cache_markdown``.
+    _MD_CACHE_SIZE = 64
+
+    def _cached_markdown(self, document_id: str, revision: int) -> str | None:
+        """Return Markdown already rendered for this document revision."""
+        key = (document_id, revision)
+        with self._md_cache_lock:
+            markdown_content = self._md_cache.get(key)
+            if markdown_content is not None:
+                self._md_cache.move_to_end(key)
+        return markdown_content
+
+    def _cache_markdown(
+        self, document_id: str, revision: int, markdown_content: str
+    ) -> None:
+        """Remember the Markdown rendered for a document revision."""
+        with self._md_cache_lock:
+            self._md_cache[(document_id, revision)] = markdown_content
+            if len(self._md_cache) > self._MD_CACHE_SIZE:
+                self._md_cache.popitem(last=False)
+
+    # Number of converted documents kept by ``_convert_cached``.
+    _CONVERT_CACHE_SIZE = 64
+
+    def _convert_cached(
+        self, content_hash: str, markdown_content: str
+    ) -> list[dict[str, Any]]:
+        """Convert Markdown to Lark blocks, memoized on the content hash.
+
+        The returned list is shared with the cache and must not be
+        mutated by callers.
+        """
+        blocks = self._convert_cache.get(content_hash)
+        if blocks is not None:
+            self._convert_cache.move_to_end(content_hash)
+            return blocks
+        blocks = self._to_lark.convert(markdown_content)
+        self._convert_cache[content_hash] = blocks
+        if len(self._convert_cache) > self._CONVERT_CACHE_SIZE:
+            self._convert_cache.popitem(last=False)
+        return blocks
+
+    # Most child blocks the API accepts in one create_children call.
+    _CREATE_BATCH_SIZE = 50
 
     def _create_blocks_with_nesting(
         self,
         document_id: str,
         parent_block_id: str,
         blocks: list[dict[str, Any]],
+        index: int | None = None,
     ) -> None:
         """Create blocks under a parent, handling nested children.
 
@@ -500,45 +1229,77 @@ class SyncEngine:
         - **QUOTE_CONTAINER**: created empty, then child blocks are added
           via ``create_children`` on the container.
 
-        Flat (non-container) blocks are batched together for efficiency.
+        Sibling blocks, including generic containers (stripped of their
+        children), are created together in one call; only tables split a
+        batch.
+        When *index* is given, the blocks are inserted starting at that
+        position among the parent's children instead of appended.
+
+        The tree is walked breadth-first with an explicit queue: each
+        parent's own blocks are created first, and the children of any
+        containers it holds are queued for later.
         """
-        flat_batch: list[dict[str, Any]] = []
+        queue: deque[tuple[str, list[dict[str, Any]], int | None]] = deque(
+            [(parent_block_id, blocks, index)]
+        )
 
-        for block in blocks:
-            children = block.get("children")
-            if not children:
-                flat_batch.append(block)
-                continue
+        while queue:
+            parent_id, level, index = queue.popleft()
+            flat_batch: list[dict[str, Any]] = []
+            # (position in flat_batch, children) for containers in the batch.
+            nested: list[tuple[int, list[dict[str, Any]]]] = []
 
-            # Flush any pending flat batch before handling a container.
-            if flat_batch:
-                self._client.blocks.create_children(
-                    document_id, parent_block_id, flat_batch
+            def flush() -> None:
+                nonlocal index
+                created = self._create_children(
+                    document_id, parent_id, flat_batch, index=index
                 )
-                flat_batch = []
-
-            bt = BlockType.from_value(block.get("block_type", 0))
-
-            if bt == BlockType.TABLE:
-                self._create_table_block(document_id, parent_block_id, block)
-            else:
-                # Generic container: create without children, then add children.
-                container = {k: v for k, v in block.items() if k != "children"}
-                created = self._client.blocks.create_children(
-                    document_id, parent_block_id, [container]
-                )
-                if created:
-                    created_id = getattr(created[0], "block_id", None)
+                if index is not None:
+                    index += len(flat_batch)
+                for pos, children in nested:
+                    created_id = (
+                        getattr(created[pos], "block_id", None)
+                        if pos < len(created)
+                        else None
+                    )
                     if created_id:
-                        self._create_blocks_with_nesting(
-                            document_id, created_id, children
-                        )
-
-        # Flush any remaining flat batch.
-        if flat_batch:
-            self._client.blocks.create_children(
-                document_id, parent_block_id, flat_batch
-            )
+                        queue.append((created_id, children, None))
+                    else:
+                        self._partial_write = True
+                flat_batch.clear()
+                nested.clear()
+
+            for block in level:
+                children = block.get("children")
+                if not children:
+                    flat_batch.append(block)
+                    continue
+
+                bt = BlockType.from_value(block.get("block_type", 0))
+
+                if bt == BlockType.TABLE:
+                    # Tables are created and filled by their own calls, so
+                    # flush the pending batch first to keep block order.
+                    if flat_batch:
+                        flush()
+                    created_table = self._create_table_block(
+                        document_id, parent_id, block, index=index
+                    )
+                    if created_table and index is not None:
+                        index += 1
+                    continue
+
+                # Generic container: create it without children in the same
+                # batch as its siblings, then queue its children under the
+                # new block.
+                nested.append((len(flat_batch), children))
+                flat_batch.append(
+                    {k: v for k, v in block.items() if k != "children"}
+                )
+
+            # Flush any remaining flat batch.
+            if flat_batch:
+                flush()
 
     # Maximum rows the Lark API allows in a single table creation call.
     _MAX_TABLE_ROWS = 9
@@ -550,7 +1311,8 @@ class SyncEngine:
         document_id: str,
         parent_block_id: str,
         table_block: dict[str, Any],
-    ) -> None:
+        index: int | None = None,
+    ) -> bool:
         """Create a TABLE block and populate its cells.
 
         The Lark API auto-creates TABLE_CELL blocks (each with an empty TEXT
@@ -558,7 +1320,11 @@ class SyncEngine:
         to set the actual cell content.
 
         Tables exceeding 9 rows are created with 9 rows initially, then
-        additional rows are appended via ``insert_table_row``.
+        additional rows are appended via ``insert_table_row``.  Steps that
+        fail without raising set ``_partial_write``.
+
+        Returns:
+            ``True`` if a TABLE block was created under the parent.
         """
         children = table_block.get("children") or []
         table_body = table_block.get("table") or {}
@@ -567,7 +1333,7 @@ class SyncEngine:
         col_count: int = prop.get("column_size", 0)
 
         if total_rows == 0 or col_count == 0:
-            return
+            return False
 
         # 1. Create the TABLE block (capped at 9 rows).
         initial_rows = min(total_rows, self._MAX_TABLE_ROWS)
@@ -580,45 +1346,34 @@ class SyncEngine:
                 },
             },
         }
-        created = self._client.blocks.create_children(
-            document_id, parent_block_id, [create_block]
+        created = self._create_children(
+            document_id, parent_block_id, [create_block], index=index
         )
         if not created:
-            return
+            self._partial_write = True
+            return False
 
         table_obj = created[0]
         table_id = getattr(table_obj, "block_id", None)
         if not table_id:
-            return
+            self._partial_write = True
+            return True
 
         # 2. Insert additional rows if the table exceeds 9 rows.
+        table_updates: list[Any] = []
         for row_idx in range(initial_rows, total_rows):
             insert_row = (
                 InsertTableRowRequest.builder().row_index(row_idx).build()
             )
-            update_body = (
+            table_updates.append(
                 UpdateBlockRequest.builder()
                 .block_id(table_id)
                 .insert_table_row(insert_row)
                 .build()
             )
-            request = (
-                PatchDocumentBlockRequest.builder()
-                .document_id(document_id)
-                .block_id(table_id)
-                .request_body(update_body)
-                .build()
-            )
-            response = self._client.raw.docx.v1.document_block.patch(request)
-            if not response.success():
-                logger.warning(
-                    "Failed to insert table row %d: code=%s, msg=%s",
-                    row_idx,
-                    response.code,
-                    response.msg,
-                )
 
-        # 3. Set column widths to fill the page (~686px).
+        # 3. Set column widths to fill the page (~686px).  Row inserts and
+        #    width updates are sent together in a single batch update.
         col_width = self._TABLE_PAGE_WIDTH // col_count
         for col_idx in range(col_count):
             update_table = (
@@ -627,46 +1382,50 @@ class SyncEngine:
                 .column_width(col_width)
                 .build()
             )
-            update_body = (
+            table_updates.append(
                 UpdateBlockRequest.builder()
                 .block_id(table_id)
                 .update_table_property(update_table)
                 .build()
             )
-            request = (
-                PatchDocumentBlockRequest.builder()
-                .document_id(document_id)
-                .block_id(table_id)
-                .request_body(update_body)
-                .build()
-            )
-            self._client.raw.docx.v1.document_block.patch(request)
-
-        # 4. Refresh the table block to get all cell IDs (including new rows).
-        table_obj = self._client.blocks.get_block(document_id, table_id)
-        cell_ids: list[str] = getattr(table_obj, "children", None) or []
+        self._batch_update(document_id, table_updates, "update table layout")
+
+        # 4. Stream the document's blocks once to resolve all cell IDs
+        #    (including new rows) and the TEXT child block ID of each cell,
+        #    keeping only the table and its cells and stopping as soon as
+        #    all of them have been seen.
+        cell_ids: list[str] | None = None
+        cell_children: dict[str, list[str]] = {}
+        # SDK blocks always carry these attributes (unset ones are None),
+        # so one C-level getter replaces three getattr calls per block.
+        fields = operator.attrgetter("block_id", "parent_id", "children")
+        for b in self._client.blocks.iter_all_blocks(document_id):
+            block_id, parent_id, block_children = fields(b)
+            if block_id == table_id:
+                cell_ids = block_children or []
+            elif parent_id == table_id:
+                cell_children[block_id] = block_children or []
+            else:
+                continue
+            if cell_ids is not None and len(cell_children) >= len(cell_ids):
+                break
 
         if not cell_ids:
-            return
+            self._partial_write = True
+            return True
 
-        # 4. Get the TEXT child block ID for each cell.
         cell_text_ids: list[str] = []
         for cid in cell_ids:
-            cell = self._client.blocks.get_block(document_id, cid)
-            cell_children = getattr(cell, "children", None) or []
-            cell_text_ids.append(cell_children[0] if cell_children else "")
+            texts = cell_children.get(cid)
+            cell_text_ids.append(texts[0] if texts else "")
 
         # 5. Build batch update requests to populate cell content.
+        # Every cell uses the same (empty) text style, so build it once.
+        style = TextElementStyle.builder().build()
         updates: list[Any] = []
-        for i, text_block_id in enumerate(cell_text_ids):
-            if not text_block_id:
-                continue
-
-            cell_text = self._extract_cell_text(children, i)
-            if not cell_text:
-                continue
-
-            style = TextElementStyle.builder().build()
+        for text_block_id, cell_text in self._iter_cell_texts(
+            children, cell_text_ids
+        ):
             text_run = (
                 TextRun.builder()
                 .content(cell_text)
@@ -686,58 +1445,159 @@ class SyncEngine:
             updates.append(update)
 
         # 6. Execute batch update.
-        if updates:
-            body = (
-                BatchUpdateDocumentBlockRequestBody.builder()
-                .requests(updates)
-                .build()
+        self._batch_update(document_id, updates, "batch-update table cells")
+        return True
+
+    def _fetch_block_dicts(self, document_id: str) -> list[dict[str, Any]]:
+        """List a document's blocks and convert them to plain dicts.
+
+        Pages are converted as they arrive so the SDK objects are never
+        all alive at once.
+        """
+        return [
+            _block_to_dict(b)
+            for b in self._client.blocks.iter_all_blocks(document_id)
+        ]
+
+    def _create_children(
+        self,
+        document_id: str,
+        parent_block_id: str,
+        children: list[dict[str, Any]],
+        index: int | None = None,
+    ) -> list[Any]:
+        """Create child blocks under a parent.
+
+        Children are sent ``_CREATE_BATCH_SIZE`` at a time, the most the
+        API accepts per call.  The calls are made in order because each
+        inserts relative to the children already created.
+        """
+        if len(children) <= self._CREATE_BATCH_SIZE:
+            return self._client.blocks.create_children(
+                document_id, parent_block_id, children, index=index
             )
-            request = (
-                BatchUpdateDocumentBlockRequest.builder()
-                .document_id(document_id)
-                .request_body(body)
-                .build()
+
+        created: list[Any] = []
+        for start in range(0, len(children), self._CREATE_BATCH_SIZE):
+            chunk = children[start:start + self._CREATE_BATCH_SIZE]
+            created.extend(
+                self._client.blocks.create_children(
+                    document_id, parent_block_id, chunk, index=index
+                )
             )
-            response = self._client.raw.docx.v1.document_block.batch_update(
-                request
+            if index is not None:
+                index += len(chunk)
+        return created
+
+    def _batch_update(
+        self, document_id: str, updates: list[Any], operation: str
+    ) -> None:
+        """Send *updates* as one ``batch_update`` call, logging failures."""
+        if not updates:
+            return
+        body = (
+            BatchUpdateDocumentBlockRequestBody.builder()
+            .requests(updates)
+            .build()
+        )
+        request = (
+            BatchUpdateDocumentBlockRequest.builder()
+            .document_id(document_id)
+            .request_body(body)
+            .build()
+        )
+        response = self._client.raw.docx.v1.document_block.batch_update(request)
+        if response.success():
+            self._client.blocks.record_revision(document_id, response)
+        else:
+            self._partial_write = True
+            logger.warning(
+                "Failed to %s: code=%s, msg=%s",
+                operation,
+                response.code,
+                response.msg,
             )
-            if not response.success():
-                logger.warning(
-                    "Failed to batch-update table cells: code=%s, msg=%s",
-                    response.code,
-                    response.msg,
-                )
+
+    @classmethod
+    def _iter_cell_texts(
+        cls, children: list[dict[str, Any]], cell_text_ids: list[str]
+    ) -> Iterator[tuple[str, str]]:
+        """Yield ``(text_block_id, text)`` for each cell with content to set.
+
+        Pairs converter TABLE_CELL children with the created cells' TEXT
+        block IDs in a single pass, skipping cells without a TEXT block
+        or without text.
+        """
+        for text_block_id, cell_dict in zip(cell_text_ids, children):
+            if not text_block_id:
+                continue
+            cell_text = cls._extract_cell_text(cell_dict)
+            if cell_text:
+                yield text_block_id, cell_text
 
     @staticmethod
-    def _extract_cell_text(
-        children: list[dict[str, Any]], index: int
-    ) -> str:
+    def _extract_cell_text(cell_dict: dict[str, Any]) -> str:
         """Extract plain text content from a converter TABLE_CELL child."""
-        if index >= len(children):
-            return ""
-        cell_dict = children[index]
         cell_children = cell_dict.get("children") or []
         if not cell_children:
             return ""
         text_dict = cell_children[0]
         text_body = text_dict.get("text") or {}
         elements = text_body.get("elements") or []
-        parts = []
-        for el in elements:
-            tr = el.get("text_run") or {}
-            parts.append(tr.get("content", ""))
-        return "".join(parts)
+        return "".join(
+            (el.get("text_run") or {}).get("content", "") for el in elements
+        )
+
+    def _apply_block_diff(
+        self,
+        document_id: str,
+        old_hashes: list[str],
+        new_blocks: list[dict[str, Any]],
+        new_hashes: list[str],
+    ) -> bool:
+        """Rewrite only the top-level blocks that changed since the last push.
+
+        Assumes the document's root children are exactly the blocks the
+        last push created (one per entry in *old_hashes*).  Returns
+        ``False`` without writing anything if the root's child count says
+        otherwise, so the caller can fall back to a full rewrite.  When no
+        top-level block changed, nothing is fetched or written.
+        """
+        edits = self._differ.diff_blocks(old_hashes, new_hashes)
+        if not edits:
+            return True
+
+        root = self._client.blocks.get_block(document_id, document_id)
+        root_children = getattr(root, "children", None) or []
+        if len(root_children) != len(old_hashes):
+            return False
+
+        # Apply edits back to front so earlier indices stay valid.
+        for edit in reversed(edits):
+            if edit.old_end > edit.old_start:
+                self._client.blocks.batch_delete(
+                    document_id, document_id, edit.old_start, edit.old_end
+                )
+            if edit.new_end > edit.new_start:
+                self._create_blocks_with_nesting(
+                    document_id,
+                    document_id,
+                    new_blocks[edit.new_start:edit.new_end],
+                    index=edit.old_start,
+                )
+        return True
 
     def _clear_document_blocks(self, document_id: str) -> None:
-        """Remove all child blocks from a document's root page block."""
-        raw_blocks = self._client.blocks.list_all_blocks(document_id)
-
-        child_count = 0
-        for b in raw_blocks:
-            bid = getattr(b, "block_id", None) or (b.get("block_id") if isinstance(b, dict) else None)
-            pid = getattr(b, "parent_id", None) or (b.get("parent_id") if isinstance(b, dict) else None)
-            if bid != document_id and pid == document_id:
-                child_count += 1
+        """Remove all child blocks from a document's root page block.
+
+        The number of children is read from the root block alone rather
+        than from a listing of the whole document.
+
+        Args:
+            document_id: The document to clear.
+        """
+        root = self._client.blocks.get_block(document_id, document_id)
+        child_count = len(getattr(root, "children", None) or [])
 
         if child_count > 0:
             self._client.blocks.batch_delete(
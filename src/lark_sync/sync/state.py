@@ -6,14 +6,21 @@ cloud documents so the sync engine can detect changes and conflicts.
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import json
+import logging
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from enum import StrEnum
 from pathlib import Path
 
 from pydantic import BaseModel, Field
 
+logger = logging.getLogger(__name__)
+
 
 class SyncDirection(StrEnum):
     """Direction of sync for a given mapping."""
@@ -35,6 +42,28 @@ class SyncMapping(BaseModel):
     local_hash_at_sync: str = ""
     remote_revision_at_sync: int = 0
     sync_direction: SyncDirection = SyncDirection.BIDIRECTIONAL
+    # Hashes of the top-level blocks created by the last push, used to
+    # update the document incrementally.  Empty when unknown.
+    block_hashes: list[str] = Field(default_factory=list)
+    # Local file ``st_mtime_ns`` / ``st_size`` at the last sync; when both
+    # still match, ``local_hash_at_sync`` is reused without rehashing.
+    local_mtime_ns: int = 0
+    local_size: int = 0
+
+
+# ``SyncMapping`` fields that only describe this machine's last sync.
+# Project-local state files are committed, so these are kept in a
+# per-user cache file instead (see ``SyncStateManager``).
+_LOCAL_CACHE_FIELDS = frozenset({"block_hashes", "local_mtime_ns", "local_size"})
+
+
+def _default_cache_file(state_file: Path) -> Path:
+    """Return the per-user cache file for a project state file."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    key = hashlib.sha256(str(state_file.resolve()).encode("utf-8")).hexdigest()
+    return Path(cache_home) / "lark-sync" / f"{key[:32]}.json"
 
 
 class SyncState(BaseModel):
@@ -44,11 +73,17 @@ class SyncState(BaseModel):
     mappings: list[SyncMapping] = Field(default_factory=list)
 
 
-def compute_file_hash(file_path: str) -> str:
+# Read size used when streaming a file through ``compute_file_hash``.
+_HASH_CHUNK_SIZE = 64 * 1024
+
+
+def compute_file_hash(file_path: str | Path) -> str:
     """Compute a SHA-256 hash of a file's content after normalizing line endings.
 
     Line endings are normalized to ``\\n`` before hashing so that the
-    same logical content produces the same hash across platforms.
+    same logical content produces the same hash across platforms.  The
+    file is streamed in fixed-size chunks; the result matches
+    ``compute_content_hash`` of the decoded text.
 
     Args:
         file_path: Absolute or relative path to the file.
@@ -59,9 +94,62 @@ def compute_file_hash(file_path: str) -> str:
     Raises:
         FileNotFoundError: If the file does not exist.
     """
-    content = Path(file_path).read_text(encoding="utf-8")
-    normalized = content.replace("\r\n", "\n").replace("\r", "\n")
-    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+    digest = hashlib.sha256()
+    carry = b""
+    with open(file_path, "rb") as f:
+        while chunk := f.read(_HASH_CHUNK_SIZE):
+            buf = carry + chunk
+            # A trailing CR may be the first half of a CRLF split across
+            # chunks; hold it back until the next chunk is seen.
+            if buf.endswith(b"\r"):
+                carry, buf = b"\r", buf[:-1]
+            else:
+                carry = b""
+            digest.update(buf.replace(b"\r\n", b"\n").replace(b"\r", b"\n"))
+    if carry:
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+def compute_file_hash_cached(
+    file_path: str | Path, mapping: SyncMapping | None
+) -> str:
+    """Like ``compute_file_hash``, but trusts the mapping's fingerprint.
+
+    When the file's modification time and size still equal those recorded
+    in *mapping* at the last sync, the stored ``local_hash_at_sync`` is
+    returned without reading the file.  Otherwise the hash is memoized
+    on the file's current modification time and size.
+
+    Args:
+        file_path: Absolute or relative path to the file.
+        mapping: The mapping last synced for this file, if any.
+
+    Returns:
+        Hex-encoded SHA-256 digest string.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+    """
+    st = os.stat(file_path)
+    if (
+        mapping is not None
+        and mapping.local_hash_at_sync
+        and st.st_mtime_ns == mapping.local_mtime_ns
+        and st.st_size == mapping.local_size
+    ):
+        return mapping.local_hash_at_sync
+    return _hash_for_stat(os.fspath(file_path), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=256)
+def _hash_for_stat(file_path: str, mtime_ns: int, size: int) -> str:
+    """Hash *file_path*, memoized on its modification time and size.
+
+    Covers files edited since their last sync, whose stored fingerprint
+    no longer matches, so repeated status checks hash them only once.
+    """
+    return compute_file_hash(file_path)
 
 
 def compute_content_hash(content: str) -> str:
@@ -77,6 +165,44 @@ def compute_content_hash(content: str) -> str:
     return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
 
 
+@functools.lru_cache(maxsize=4096)
+def _normalize_path_cached(project_root: str, local_path: str) -> str:
+    """Return *local_path* as stored by a project-local state manager."""
+    p = Path(local_path)
+    if p.is_absolute():
+        try:
+            return p.relative_to(project_root).as_posix()
+        except ValueError:
+            # Path is outside project — store as-is.
+            return local_path
+    return p.as_posix()
+
+
+def _construct_state(raw: bytes) -> SyncState:
+    """Build a ``SyncState`` from trusted state-file JSON without validation.
+
+    Only the fields that need conversion from JSON types are converted.
+    Anything unexpected falls back to ``model_validate_json``.
+    """
+    try:
+        data = json.loads(raw)
+        mappings = []
+        for m in data.get("mappings", []):
+            if not {"local_path", "lark_document_id"} <= m.keys():
+                raise KeyError("mapping is missing required fields")
+            synced_at = m.get("last_synced_at")
+            if synced_at is not None:
+                m["last_synced_at"] = datetime.fromisoformat(synced_at)
+            if "sync_direction" in m:
+                m["sync_direction"] = SyncDirection(m["sync_direction"])
+            mappings.append(SyncMapping.model_construct(**m))
+        return SyncState.model_construct(
+            version=data.get("version", 1), mappings=mappings
+        )
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return SyncState.model_validate_json(raw)
+
+
 class SyncStateManager:
     """Manages reading, writing, and querying the JSON sync state file.
 
@@ -86,19 +212,44 @@ class SyncStateManager:
 
     When ``project_root`` is provided, paths are stored as POSIX-style
     relative paths (e.g. ``docs/prd.md``) and resolved against
-    ``project_root`` for file operations.
+    ``project_root`` for file operations.  The machine-specific
+    ``block_hashes``, ``local_mtime_ns`` and ``local_size`` are then
+    kept out of the (committed) state file, in a per-user cache file.
 
     Args:
         state_file: Path to the JSON state file.
         project_root: Optional project root for relative path support.
+        cache_file: Per-user cache file for project-local state.
+            Defaults to a file under ``$XDG_CACHE_HOME/lark-sync``.
     """
 
     def __init__(
-        self, state_file: str, project_root: Path | None = None
+        self,
+        state_file: str,
+        project_root: Path | None = None,
+        cache_file: str | None = None,
     ) -> None:
         self._state_file = Path(state_file)
         self._project_root = project_root
+        self._cache_file: Path | None = None
+        if project_root is not None:
+            self._cache_file = (
+                Path(cache_file)
+                if cache_file is not None
+                else _default_cache_file(self._state_file)
+            )
         self._state: SyncState | None = None
+        # Lookup indices over ``self._state.mappings``; rebuilt on load and
+        # ``save``, and kept current by the mapping helpers.
+        self._by_path: dict[str, SyncMapping] = {}
+        self._by_doc_id: dict[str, SyncMapping] = {}
+        # (mtime_ns, size) of the state file when ``self._state`` was
+        # last read or written; lets ``load`` skip unchanged files.
+        self._loaded_stat: tuple[int, int] | None = None
+        # Nesting depth of ``batch()`` blocks, and whether a save was
+        # deferred by one.
+        self._batch_depth = 0
+        self._dirty = False
 
     @property
     def project_root(self) -> Path | None:
@@ -108,34 +259,174 @@ class SyncStateManager:
     # Persistence
     # ------------------------------------------------------------------
 
-    def load(self) -> SyncState:
+    def load(self, validate: bool = True) -> SyncState:
         """Load sync state from disk, returning an empty state if the file
         does not exist or is empty.
 
+        The parsed state is reused as long as the file's modification
+        time and size are unchanged since it was last read or written.
+        Inside a ``batch()`` block (or while a deferred save is pending)
+        the in-memory state is always returned so unsaved changes are
+        never discarded.
+
+        Args:
+            validate: Run full Pydantic validation.  When ``False``, the
+                models are built directly from the parsed JSON (falling
+                back to validation if the data is not shaped as
+                expected), which is cheaper for read-only callers.
+
         Returns:
             The deserialized ``SyncState``.
         """
-        if self._state_file.exists() and self._state_file.stat().st_size > 0:
-            raw = self._state_file.read_text(encoding="utf-8")
-            self._state = SyncState.model_validate_json(raw)
+        if self._state is not None and (self._batch_depth or self._dirty):
+            return self._state
+
+        try:
+            st = self._state_file.stat()
+        except FileNotFoundError:
+            st = None
+
+        file_stat = (st.st_mtime_ns, st.st_size) if st is not None else None
+        if (
+            self._state is not None
+            and file_stat is not None
+            and file_stat == self._loaded_stat
+        ):
+            return self._state
+
+        if file_stat is not None and file_stat[1] > 0:
+            raw = self._state_file.read_bytes()
+            self._state = (
+                SyncState.model_validate_json(raw)
+                if validate
+                else _construct_state(raw)
+            )
         else:
             self._state = SyncState()
+        self._loaded_stat = file_stat
+        self._apply_local_cache(self._state)
+        self._reindex(self._state)
         return self._state
 
     def save(self, state: SyncState) -> None:
         """Persist the given sync state to disk as pretty-printed JSON.
 
         Parent directories are created automatically if they do not exist.
+        Inside a ``batch()`` block the write is deferred until the
+        outermost block exits.
 
         Args:
             state: The ``SyncState`` to write.
         """
         self._state = state
+        self._reindex(state)
+        self._persist()
+
+    def _persist(self) -> None:
+        """Write the in-memory state, or defer it inside ``batch()``.
+
+        Mapping helpers keep the lookup indices up to date themselves, so
+        unlike ``save`` nothing is reindexed here.
+        """
+        assert self._state is not None  # noqa: S101
+        if self._batch_depth:
+            self._dirty = True
+            return
+        self._write(self._state)
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Defer state-file writes until the block exits.
+
+        Mutations made inside the block update the in-memory state
+        immediately, but the file is written at most once, when the
+        outermost ``batch()`` exits (even if it exits with an error).
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._dirty:
+                self._dirty = False
+                assert self._state is not None  # noqa: S101
+                self._write(self._state)
+
+    def _write(self, state: SyncState) -> None:
+        """Write *state* to the state file atomically.
+
+        The JSON is written to a sibling temp file which then replaces
+        the state file, so a crash mid-write never leaves a truncated
+        file behind.  Output stays pretty-printed because project state
+        files are committed and reviewed as diffs.
+        """
+        exclude = None
+        if self._cache_file is not None:
+            exclude = {"mappings": {"__all__": set(_LOCAL_CACHE_FIELDS)}}
+            self._write_local_cache(state)
         self._state_file.parent.mkdir(parents=True, exist_ok=True)
-        self._state_file.write_text(
-            state.model_dump_json(indent=2) + "\n",
-            encoding="utf-8",
+        tmp = self._state_file.with_name(self._state_file.name + ".tmp")
+        tmp.write_bytes(
+            state.model_dump_json(indent=2, exclude=exclude).encode("utf-8")
+            + b"\n"
         )
+        os.replace(tmp, self._state_file)
+        st = self._state_file.stat()
+        self._loaded_stat = (st.st_mtime_ns, st.st_size)
+
+    # ------------------------------------------------------------------
+    # Per-user cache for project-local state
+    # ------------------------------------------------------------------
+
+    def _write_local_cache(self, state: SyncState) -> None:
+        """Save the machine-specific mapping fields to the cache file.
+
+        Each entry also records the revision and hash it belongs to, so it
+        is ignored once the committed state moves on (e.g. after a
+        teammate's push is pulled).  Failures are logged, not raised: the
+        cache only saves work.
+        """
+        assert self._cache_file is not None  # noqa: S101
+        entries = {
+            m.local_path: {
+                "remote_revision_at_sync": m.remote_revision_at_sync,
+                "local_hash_at_sync": m.local_hash_at_sync,
+                **{name: getattr(m, name) for name in _LOCAL_CACHE_FIELDS},
+            }
+            for m in state.mappings
+        }
+        try:
+            self._cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self._cache_file.with_name(self._cache_file.name + ".tmp")
+            tmp.write_text(json.dumps({"mappings": entries}), encoding="utf-8")
+            os.replace(tmp, self._cache_file)
+        except OSError as exc:
+            logger.warning(
+                "Could not write sync cache %s: %s", self._cache_file, exc
+            )
+
+    def _apply_local_cache(self, state: SyncState) -> None:
+        """Restore cached machine-specific fields onto *state*'s mappings."""
+        if self._cache_file is None:
+            return
+        try:
+            entries = json.loads(self._cache_file.read_bytes())["mappings"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return
+        if not isinstance(entries, dict):
+            return
+        for mapping in state.mappings:
+            entry = entries.get(mapping.local_path)
+            if (
+                not isinstance(entry, dict)
+                or entry.get("remote_revision_at_sync")
+                != mapping.remote_revision_at_sync
+                or entry.get("local_hash_at_sync") != mapping.local_hash_at_sync
+            ):
+                continue
+            for name in _LOCAL_CACHE_FIELDS:
+                if name in entry:
+                    setattr(mapping, name, entry[name])
 
     # ------------------------------------------------------------------
     # Internal helper to ensure state is loaded
@@ -148,6 +439,30 @@ class SyncStateManager:
         assert self._state is not None  # noqa: S101
         return self._state
 
+    def _reindex(self, state: SyncState) -> None:
+        """Rebuild the path / document-ID lookup indices for *state*.
+
+        Iterates in reverse so that, as with a linear scan, the first
+        mapping wins when keys are duplicated.
+        """
+        self._by_path = {}
+        self._by_doc_id = {}
+        for mapping in reversed(state.mappings):
+            self._by_path[mapping.local_path] = mapping
+            self._by_doc_id[mapping.lark_document_id] = mapping
+
+    def _reindex_doc_id(self, state: SyncState, document_id: str) -> None:
+        """Point the document-ID index at the first mapping for *document_id*.
+
+        Only needed when the indexed mapping for that ID was removed or
+        re-pointed, or another mapping may now precede it.
+        """
+        for mapping in state.mappings:
+            if mapping.lark_document_id == document_id:
+                self._by_doc_id[document_id] = mapping
+                return
+        self._by_doc_id.pop(document_id, None)
+
     # ------------------------------------------------------------------
     # Query helpers
     # ------------------------------------------------------------------
@@ -165,12 +480,8 @@ class SyncStateManager:
         Returns:
             The matching ``SyncMapping`` or ``None``.
         """
-        state = self._ensure_loaded()
-        lookup = self._normalize_path(local_path)
-        for mapping in state.mappings:
-            if mapping.local_path == lookup:
-                return mapping
-        return None
+        self._ensure_loaded()
+        return self._by_path.get(self._normalize_path(local_path))
 
     def get_mapping_by_doc_id(self, document_id: str) -> SyncMapping | None:
         """Look up a mapping by Lark document ID.
@@ -181,11 +492,8 @@ class SyncStateManager:
         Returns:
             The matching ``SyncMapping`` or ``None``.
         """
-        state = self._ensure_loaded()
-        for mapping in state.mappings:
-            if mapping.lark_document_id == document_id:
-                return mapping
-        return None
+        self._ensure_loaded()
+        return self._by_doc_id.get(document_id)
 
     # ------------------------------------------------------------------
     # Mutation helpers
@@ -204,16 +512,29 @@ class SyncStateManager:
         state = self._ensure_loaded()
         normalized = self._normalize_path(mapping.local_path)
         # Remove any existing mapping for the same path.
-        state.mappings = [
-            m for m in state.mappings if m.local_path != normalized
-        ]
+        previous = self._by_path.get(normalized)
+        if previous is not None:
+            state.mappings = [
+                m for m in state.mappings if m.local_path != normalized
+            ]
         mapping.local_path = normalized
         state.mappings.append(mapping)
-        self.save(state)
+
+        self._by_path[normalized] = mapping
+        if (
+            previous is not None
+            and self._by_doc_id.get(previous.lark_document_id) is previous
+        ):
+            self._reindex_doc_id(state, previous.lark_document_id)
+        # Appended last, so it only wins when no other mapping has its ID.
+        self._by_doc_id.setdefault(mapping.lark_document_id, mapping)
+        self._persist()
 
     def update_mapping(self, local_path: str, **updates: object) -> None:
         """Update fields on an existing mapping and persist.
 
+        Nothing is written when every field already has its new value.
+
         Args:
             local_path: The path identifying the mapping to update.
             **updates: Keyword arguments corresponding to ``SyncMapping``
@@ -224,13 +545,22 @@ class SyncStateManager:
         """
         state = self._ensure_loaded()
         lookup = self._normalize_path(local_path)
-        for mapping in state.mappings:
-            if mapping.local_path == lookup:
-                for key, value in updates.items():
-                    setattr(mapping, key, value)
-                self.save(state)
-                return
-        raise KeyError(f"No mapping found for local path: {lookup}")
+        mapping = self._by_path.get(lookup)
+        if mapping is None:
+            raise KeyError(f"No mapping found for local path: {lookup}")
+        old_document_id = mapping.lark_document_id
+        changed = False
+        for key, value in updates.items():
+            if getattr(mapping, key) != value:
+                setattr(mapping, key, value)
+                changed = True
+        if not changed:
+            return
+        if mapping.lark_document_id != old_document_id:
+            if self._by_doc_id.get(old_document_id) is mapping:
+                self._reindex_doc_id(state, old_document_id)
+            self._reindex_doc_id(state, mapping.lark_document_id)
+        self._persist()
 
     def remove_mapping(self, local_path: str) -> None:
         """Remove a mapping by local path and persist.
@@ -242,10 +572,15 @@ class SyncStateManager:
         """
         state = self._ensure_loaded()
         lookup = self._normalize_path(local_path)
+        removed = self._by_path.pop(lookup, None)
+        if removed is None:
+            return
         state.mappings = [
             m for m in state.mappings if m.local_path != lookup
         ]
-        self.save(state)
+        if self._by_doc_id.get(removed.lark_document_id) is removed:
+            self._reindex_doc_id(state, removed.lark_document_id)
+        self._persist()
 
     # ------------------------------------------------------------------
     # Path helpers
@@ -259,14 +594,7 @@ class SyncStateManager:
         """
         if self._project_root is None:
             return local_path
-        p = Path(local_path)
-        if p.is_absolute():
-            try:
-                return p.relative_to(self._project_root).as_posix()
-            except ValueError:
-                # Path is outside project — store as-is.
-                return local_path
-        return p.as_posix()
+        return _normalize_path_cached(str(self._project_root), local_path)
 
     def resolve_path(self, local_path: str) -> str:
         """Resolve a stored path to an absolute path for file operations.
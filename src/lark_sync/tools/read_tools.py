@@ -2,32 +2,38 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+from anyio import to_thread
 from mcp.server.fastmcp import FastMCP
 
-from lark_sync.converter import LarkToMarkdownConverter
 from lark_sync.lark_client import LarkClient
 
+if TYPE_CHECKING:
+    # The engine imports ``_block_to_dict`` from this module.
+    from lark_sync.sync.engine import SyncEngine
 
-def register_read_tools(mcp: FastMCP, client: LarkClient) -> None:
-    """Register read-only tools with the MCP server."""
 
-    converter = LarkToMarkdownConverter()
+def register_read_tools(
+    mcp: FastMCP, client: LarkClient, engine: SyncEngine
+) -> None:
+    """Register read-only tools with the MCP server.
+
+    FastMCP calls synchronous tools on the event loop, so each tool runs
+    its blocking Lark requests in a worker thread.
+    """
 
     @mcp.tool()
-    def read_document(document_id: str) -> str:
+    async def read_document(document_id: str) -> str:
         """Read a Lark cloud document and return its content as Markdown.
 
         Args:
             document_id: The Lark document ID (e.g. 'doxcnXYZ123').
         """
-        blocks = client.blocks.list_all_blocks(document_id)
-        block_dicts = [_block_to_dict(b) for b in blocks]
-        return converter.convert(block_dicts)
+        return await to_thread.run_sync(engine.read_markdown, document_id)
 
     @mcp.tool()
-    def list_documents(
+    async def list_documents(
         folder_token: str | None = None,
         wiki_space_id: str | None = None,
     ) -> list[dict[str, Any]]:
@@ -40,49 +46,54 @@ def register_read_tools(mcp: FastMCP, client: LarkClient) -> None:
             folder_token: Lark Drive folder token.
             wiki_space_id: Wiki space ID to list nodes from.
         """
-        if wiki_space_id:
-            nodes = client.wiki.list_all_nodes(wiki_space_id)
-            return [
-                {
-                    "node_token": n.node_token,
-                    "obj_token": n.obj_token,
-                    "title": n.title,
-                    "obj_type": n.obj_type,
-                    "has_child": n.has_child,
-                }
-                for n in nodes
-            ]
-        if folder_token:
-            files = client.drive.list_all_files(folder_token)
+        def fetch() -> list[dict[str, Any]]:
+            if wiki_space_id:
+                nodes = client.wiki.list_all_nodes(wiki_space_id)
+                return [
+                    {
+                        "node_token": n.node_token,
+                        "obj_token": n.obj_token,
+                        "title": n.title,
+                        "obj_type": n.obj_type,
+                        "has_child": n.has_child,
+                    }
+                    for n in nodes
+                ]
+            if folder_token:
+                files = client.drive.list_all_files(folder_token)
+                return [
+                    {
+                        "token": f.token,
+                        "name": f.name,
+                        "type": f.type,
+                        "url": f.url,
+                    }
+                    for f in files
+                ]
+            # Default: list wiki spaces
+            spaces = client.wiki.list_all_spaces()
             return [
                 {
-                    "token": f.token,
-                    "name": f.name,
-                    "type": f.type,
-                    "url": f.url,
+                    "space_id": s.space_id,
+                    "name": s.name,
+                    "description": s.description,
                 }
-                for f in files
+                for s in spaces
             ]
-        # Default: list wiki spaces
-        spaces = client.wiki.list_all_spaces()
-        return [
-            {
-                "space_id": s.space_id,
-                "name": s.name,
-                "description": s.description,
-            }
-            for s in spaces
-        ]
+
+        return await to_thread.run_sync(fetch)
 
     @mcp.tool()
-    def search_documents(query: str, count: int = 20) -> list[dict[str, str]]:
+    async def search_documents(query: str, count: int = 20) -> list[dict[str, str]]:
         """Search Lark documents by keyword.
 
         Args:
             query: Search query string.
             count: Maximum number of results (default 20, max 50).
         """
-        results = client.search.search_all(query, max_results=min(count, 50))
+        results = await to_thread.run_sync(
+            lambda: client.search.search_all(query, max_results=min(count, 50))
+        )
         return [
             {
                 "doc_id": r.doc_id,
@@ -94,23 +105,38 @@ def register_read_tools(mcp: FastMCP, client: LarkClient) -> None:
         ]
 
 
+# Exact types returned unchanged by ``_convert_value``; checked with a set
+# lookup on ``type(value)`` before the slower ``isinstance`` fallbacks.
+_PRIMITIVES = frozenset({str, int, float, bool, type(None)})
+
+
 def _block_to_dict(block: Any) -> dict[str, Any]:
     """Recursively convert a lark_oapi Block object to a plain dict."""
     if isinstance(block, dict):
         return {k: _convert_value(v) for k, v in block.items()}
-    if hasattr(block, "__dict__"):
-        d: dict[str, Any] = {}
-        for key, value in block.__dict__.items():
-            if key.startswith("_"):
-                continue
-            d[key] = _convert_value(value)
-        return d
+    attrs = getattr(block, "__dict__", None)
+    if attrs is not None:
+        return {
+            k: v if type(v) in _PRIMITIVES else _convert_value(v)
+            for k, v in attrs.items()
+            if not k.startswith("_")
+        }
     return {"raw": str(block)}
 
 
 def _convert_value(value: Any) -> Any:
     """Recursively convert SDK objects, lists, and dicts to plain types."""
-    if value is None or isinstance(value, (str, int, float, bool)):
+    cls = type(value)
+    if cls in _PRIMITIVES:
+        return value
+    if cls is list:
+        return [
+            v if type(v) in _PRIMITIVES else _convert_value(v) for v in value
+        ]
+    if cls is dict:
+        return {k: _convert_value(v) for k, v in value.items()}
+    # Subclasses (e.g. str enums) take the slower generic checks.
+    if isinstance(value, (str, int, float, bool)):
         return value
     if isinstance(value, list):
         return [_convert_value(item) for item in value]
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from pathlib import Path
+import os
+from concurrent.futures import Future
 from typing import Any
 
+from anyio import to_thread
 from mcp.server.fastmcp import FastMCP
 
 from lark_sync.sync.engine import SyncEngine
@@ -12,10 +14,14 @@ from lark_sync.sync.state import SyncState, SyncStateManager
 
 
 def register_sync_tools(mcp: FastMCP, engine: SyncEngine) -> None:
-    """Register sync-from-lark and status tools with the MCP server."""
+    """Register sync-from-lark and status tools with the MCP server.
+
+    FastMCP calls synchronous tools on the event loop, so tools that hit
+    Lark, the file system or the engine lock run in a worker thread.
+    """
 
     @mcp.tool()
-    def sync_from_lark(
+    async def sync_from_lark(
         document_id: str,
         local_path: str | None = None,
         force: bool = False,
@@ -30,15 +36,111 @@ def register_sync_tools(mcp: FastMCP, engine: SyncEngine) -> None:
             local_path: Local file path to save. If None, auto-generated.
             force: If True, overwrite local even if conflicts detected.
         """
-        result = engine.sync_from_lark(
-            document_id=document_id,
-            local_path=local_path,
-            force=force,
+        result = await to_thread.run_sync(
+            lambda: engine.sync_from_lark(
+                document_id=document_id,
+                local_path=local_path,
+                force=force,
+            )
         )
-        return result.model_dump()
+        return result.to_dict()
 
     @mcp.tool()
-    def get_sync_status(local_path: str | None = None) -> list[dict[str, Any]]:
+    async def sync_batch(operations: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Run several push/pull operations in one call.
+
+        Remote fetches for upcoming pulls run a few operations ahead and
+        overlap; the operations complete in order, and sync state is
+        saved once.
+
+        Args:
+            operations: List of operations, each a dict with "action"
+                ("push" or "pull") plus that action's arguments:
+                push takes local_path and optional document_id,
+                folder_token, force; pull takes document_id and optional
+                local_path, force.
+
+        Returns:
+            One result dict per operation, in the same order.
+        """
+        def run() -> list[dict[str, Any]]:
+            # Remote fetches for upcoming pulls run a few operations ahead.
+            # Mappings are resolved when each prefetch starts, under the
+            # engine lock; see ``SyncEngine.prefetch_pulls``.
+            pulls = [
+                (i, op)
+                for i, op in enumerate(operations)
+                if op.get("action") == "pull" and op.get("document_id")
+            ]
+            window = engine.PREFETCH_WINDOW
+            prefetches: dict[int, Future[tuple[int, str] | None]] = {}
+            next_prefetch = 0
+            pulls_done = 0
+
+            results: list[dict[str, Any]] = []
+            with engine.all_states_batch():
+                for index, op in enumerate(operations):
+                    while next_prefetch < min(len(pulls), pulls_done + window):
+                        i, pull = pulls[next_prefetch]
+                        prefetches[i] = engine.prefetch_pulls(
+                            [pull["document_id"]],
+                            force=bool(pull.get("force", False)),
+                        )[0]
+                        next_prefetch += 1
+                    action = op.get("action")
+                    try:
+                        if action == "pull":
+                            prefetch = prefetches.pop(index, None)
+                            if prefetch is not None:
+                                pulls_done += 1
+                            result = engine.sync_from_lark(
+                                document_id=op["document_id"],
+                                local_path=op.get("local_path"),
+                                force=bool(op.get("force", False)),
+                                compute_diff_summary=False,
+                                prefetched=(
+                                    engine.prefetch_result(prefetch)
+                                    if prefetch is not None
+                                    else None
+                                ),
+                            )
+                        elif action == "push":
+                            result = engine.sync_to_lark(
+                                local_path=op["local_path"],
+                                document_id=op.get("document_id"),
+                                folder_token=op.get("folder_token"),
+                                force=bool(op.get("force", False)),
+                            )
+                        else:
+                            results.append({
+                                "success": False,
+                                "message": f"Unknown action: {action!r}",
+                            })
+                            continue
+                    except Exception as exc:
+                        results.append({"success": False, "message": str(exc)})
+                        continue
+                    results.append(result.to_dict())
+            return results
+
+        return await to_thread.run_sync(run)
+
+    @mcp.tool()
+    def poll_sync_job(job_id: str) -> dict[str, Any]:
+        """Check on a background job started with background=True.
+
+        Returns status "pending" or "running" while the job is in
+        progress, then "done" with the tool's usual output under
+        "result" (or "failed" with a "message").  A finished job can be
+        polled only once, and is dropped an hour after it finishes.
+
+        Args:
+            job_id: The job_id returned when the job was started.
+        """
+        return engine.job_status(job_id)
+
+    @mcp.tool()
+    async def get_sync_status(local_path: str | None = None) -> list[dict[str, Any]]:
         """Check sync status between local files and Lark documents.
 
         If local_path provided, checks status for that file only.
@@ -47,20 +149,13 @@ def register_sync_tools(mcp: FastMCP, engine: SyncEngine) -> None:
         Args:
             local_path: Optional path to check specific file status.
         """
-        entries = engine.get_sync_status(local_path=local_path)
-        return [
-            {
-                "local_path": e.local_path,
-                "document_id": e.document_id,
-                "document_url": e.document_url,
-                "status": e.status.value,
-                "last_synced": e.last_synced.isoformat() if e.last_synced else None,
-            }
-            for e in entries
-        ]
+        entries = await to_thread.run_sync(
+            lambda: engine.get_sync_status(local_path=local_path)
+        )
+        return [e.to_dict() for e in entries]
 
     @mcp.tool()
-    def init_project_sync(project_path: str) -> dict[str, Any]:
+    async def init_project_sync(project_path: str) -> dict[str, Any]:
         """Initialize a project directory for Lark sync.
 
         Creates a .lark-sync.json file at the Git repository root for
@@ -71,50 +166,62 @@ def register_sync_tools(mcp: FastMCP, engine: SyncEngine) -> None:
         Args:
             project_path: Path to a directory inside the Git repository.
         """
-        git_root = engine._find_git_root(project_path)
-        if git_root is None:
-            return {
-                "success": False,
-                "message": f"No Git repository found for: {project_path}",
-            }
+        def init() -> dict[str, Any]:
+            git_root = engine._find_git_root(project_path)
+            if git_root is None:
+                return {
+                    "success": False,
+                    "message": f"No Git repository found for: {project_path}",
+                }
+
+            state_file = git_root / engine.PROJECT_STATE_FILENAME
+            if state_file.exists():
+                return {
+                    "success": False,
+                    "message": f"Project already initialized: {state_file}",
+                }
+
+            # Create empty project state.
+            project_mgr = SyncStateManager(str(state_file), project_root=git_root)
+            project_state = SyncState()
+
+            # Migrate matching mappings from global state.
+            global_state = engine._state.load(validate=False)
+            # Resolve the root prefix once; separators only need rewriting
+            # where the OS separator is not already "/".
+            root_prefix = os.path.join(str(git_root), "")
+            prefix_len = len(root_prefix)
+            to_posix = os.sep != "/"
+            normpath = os.path.normpath
+            migrated = 0
+            for mapping in global_state.mappings:
+                # Check if this mapping's file lives inside the project.
+                local = normpath(mapping.local_path)
+                if not local.startswith(root_prefix):
+                    continue
+                rel = local[prefix_len:]
+                if to_posix:
+                    rel = rel.replace(os.sep, "/")
+
+                # Clone mapping with relative path.  The source fields are
+                # already valid, so construct the copy without validation.
+                fields = mapping.__dict__.copy()
+                fields["local_path"] = rel
+                project_state.mappings.append(type(mapping).model_construct(**fields))
+                migrated += 1
+
+            project_mgr.save(project_state)
+
+            # Cache the new project state manager in the engine.
+            engine._project_states[git_root] = project_mgr
 
-        state_file = git_root / engine.PROJECT_STATE_FILENAME
-        if state_file.exists():
             return {
-                "success": False,
-                "message": f"Project already initialized: {state_file}",
+                "success": True,
+                "state_file": str(state_file),
+                "migrated_mappings": migrated,
+                "message": (
+                    f"Initialized {state_file} with {migrated} migrated mapping(s)."
+                ),
             }
 
-        # Create empty project state.
-        project_mgr = SyncStateManager(str(state_file), project_root=git_root)
-        project_state = SyncState()
-
-        # Migrate matching mappings from global state.
-        global_state = engine._state.load()
-        migrated = 0
-        for mapping in global_state.mappings:
-            # Check if this mapping's file lives inside the project.
-            mp = Path(mapping.local_path)
-            try:
-                rel = mp.relative_to(git_root).as_posix()
-            except ValueError:
-                continue
-
-            # Clone mapping with relative path.
-            cloned = mapping.model_copy(update={"local_path": rel})
-            project_state.mappings.append(cloned)
-            migrated += 1
-
-        project_mgr.save(project_state)
-
-        # Cache the new project state manager in the engine.
-        engine._project_states[git_root] = project_mgr
-
-        return {
-            "success": True,
-            "state_file": str(state_file),
-            "migrated_mappings": migrated,
-            "message": (
-                f"Initialized {state_file} with {migrated} migrated mapping(s)."
-            ),
-        }
+        return await to_thread.run_sync(init)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import Any
 
+from anyio import to_thread
 from mcp.server.fastmcp import FastMCP
 
 from lark_sync.converter import MarkdownToLarkConverter
@@ -16,16 +17,22 @@ def register_write_tools(
     client: LarkClient,
     engine: SyncEngine,
 ) -> None:
-    """Register write and sync-to-lark tools with the MCP server."""
+    """Register write and sync-to-lark tools with the MCP server.
+
+    FastMCP calls synchronous tools on the event loop, so foreground
+    writes run in a worker thread; waiting there for the engine lock
+    leaves the server free to answer other calls.
+    """
 
     md_to_lark = MarkdownToLarkConverter()
 
     @mcp.tool()
-    def write_document(
+    async def write_document(
         content: str,
         document_id: str | None = None,
         title: str | None = None,
         folder_token: str | None = None,
+        background: bool = False,
     ) -> dict[str, str]:
         """Create or update a Lark cloud document from Markdown content.
 
@@ -37,48 +44,50 @@ def register_write_tools(
             document_id: ID of existing document to update. If None, creates new.
             title: Title for a new document. Ignored if updating.
             folder_token: Lark Drive folder token for new document placement.
+            background: If True, return a job_id immediately; poll it with
+                poll_sync_job. Use for large documents.
         """
-        blocks = md_to_lark.convert(content)
-
-        if document_id:
-            # Clear existing content and recreate
-            existing = client.blocks.list_all_blocks(document_id)
-            child_ids = [
-                _get_block_id(b)
-                for b in existing
-                if _get_block_id(b) != document_id
-                and _get_parent_id(b) == document_id
-            ]
-            if child_ids:
-                client.blocks.batch_delete(document_id, document_id, 0, len(child_ids))
-
-            if blocks:
-                engine._create_blocks_with_nesting(document_id, document_id, blocks)
-
-            doc = client.documents.get(document_id)
-            return {
-                "document_id": doc.document_id,
-                "title": doc.title,
-                "action": "updated",
-            }
-        else:
-            doc_title = title or "Untitled Document"
-            doc = client.documents.create(doc_title, folder_token)
-            if blocks:
-                engine._create_blocks_with_nesting(doc.document_id, doc.document_id, blocks)
-
+        def write() -> dict[str, str]:
+            # Fetching the document (its title is unaffected by the
+            # rewrite) touches no content or sync state, so it overlaps
+            # the conversion.  A new document is only created once
+            # conversion has succeeded, so a failure leaves nothing
+            # behind in Lark.
+            doc_future = engine.prefetch_title(document_id) if document_id else None
+            blocks = md_to_lark.convert(content)
+
+            if document_id:
+                engine.replace_document_content(document_id, blocks)
+                if doc_future is not None:
+                    doc_future.result()
+                return {
+                    "document_id": document_id,
+                    "title": engine.get_cached_title(document_id) or "",
+                    "action": "updated",
+                }
+
+            doc = client.documents.create(
+                title or "Untitled Document", folder_token
+            )
+            engine.record_title(doc.document_id, doc.title)
+            engine.replace_document_content(doc.document_id, blocks, clear=False)
             return {
                 "document_id": doc.document_id,
                 "title": doc.title,
                 "action": "created",
             }
 
+        if background:
+            return {"job_id": engine.submit_job(write), "status": "pending"}
+        return await to_thread.run_sync(write)
+
     @mcp.tool()
-    def sync_to_lark(
+    async def sync_to_lark(
         local_path: str,
         document_id: str | None = None,
         folder_token: str | None = None,
         force: bool = False,
+        background: bool = False,
     ) -> dict[str, Any]:
         """Push a local Markdown file to a Lark cloud document.
 
@@ -90,25 +99,18 @@ def register_write_tools(
             document_id: Target Lark document ID. Optional.
             folder_token: Lark Drive folder for new documents.
             force: If True, overwrite remote even if conflicts detected.
+            background: If True, return a job_id immediately; poll it with
+                poll_sync_job. Use for large documents.
         """
-        result = engine.sync_to_lark(
-            local_path=local_path,
-            document_id=document_id,
-            folder_token=folder_token,
-            force=force,
-        )
-        return result.model_dump()
-
-
-def _get_block_id(block: Any) -> str:
-    """Extract block_id from a block object or dict."""
-    if isinstance(block, dict):
-        return block.get("block_id", "")
-    return getattr(block, "block_id", "")
-
-
-def _get_parent_id(block: Any) -> str:
-    """Extract parent_id from a block object or dict."""
-    if isinstance(block, dict):
-        return block.get("parent_id", "")
-    return getattr(block, "parent_id", "")
+        def push() -> dict[str, Any]:
+            return engine.sync_to_lark(
+                local_path=local_path,
+                document_id=document_id,
+                folder_token=folder_token,
+                force=force,
+            ).to_dict()
+
+        if background:
+            return {"job_id": engine.submit_job(push), "status": "pending"}
+        return await to_thread.run_sync(push)
+
@@ -0,0 +1,26 @@
+"""Tests for ``lark_sync.lark_client.blocks``."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from lark_sync.lark_client.blocks import BlocksClient
+
+
+def _response(revision: int | None) -> SimpleNamespace:
+    return SimpleNamespace(data=SimpleNamespace(document_revision_id=revision))
+
+
+def test_write_without_revision_marks_revision_unknown() -> None:
+    blocks = BlocksClient(SimpleNamespace())
+
+    blocks.record_revision("doc", _response(5))
+    assert blocks.last_revision("doc") == 5
+    assert not blocks.revision_unknown("doc")
+
+    blocks.record_revision("doc", _response(None))
+    assert blocks.last_revision("doc") is None
+    assert blocks.revision_unknown("doc")
+
+    blocks.forget_revision("doc")
+    assert not blocks.revision_unknown("doc")
@@ -0,0 +1,27 @@
+"""Tests for ``lark_sync.sync.differ``."""
+
+from __future__ import annotations
+
+from lark_sync.sync.differ import BlockEdit, SyncDiffer
+
+
+def test_diff_blocks_unchanged_has_no_edits() -> None:
+    assert SyncDiffer.diff_blocks(["a", "b"], ["a", "b"]) == []
+
+
+def test_diff_blocks_insert_delete_and_replace() -> None:
+    assert SyncDiffer.diff_blocks(["a", "c"], ["a", "b", "c"]) == [
+        BlockEdit(1, 1, 1, 2)
+    ]
+    assert SyncDiffer.diff_blocks(["a", "b", "c"], ["a", "c"]) == [
+        BlockEdit(1, 2, 1, 1)
+    ]
+    assert SyncDiffer.diff_blocks(["a", "b", "c"], ["a", "x", "c"]) == [
+        BlockEdit(1, 2, 1, 2)
+    ]
+
+
+def test_diff_blocks_returns_edits_in_document_order() -> None:
+    edits = SyncDiffer.diff_blocks(["a", "b", "c"], ["x", "b", "c", "d"])
+
+    assert edits == [BlockEdit(0, 1, 0, 1), BlockEdit(3, 3, 3, 4)]
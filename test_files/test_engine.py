@@ -0,0 +1,408 @@
+"""Tests for ``lark_sync.sync.engine``."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from lark_sync.sync.engine import SyncEngine, clear_git_root_cache
+from lark_sync.sync.state import SyncMapping, SyncStateManager
+
+
+def test_find_git_root_sees_repository_created_later(tmp_path: Path) -> None:
+    """A miss is not cached, so a later ``git init`` is picked up."""
+    clear_git_root_cache()
+    doc = tmp_path / "notes.md"
+    doc.write_text("# Notes\n", encoding="utf-8")
+
+    assert SyncEngine._find_git_root(str(doc)) is None
+
+    (tmp_path / ".git").mkdir()
+    assert SyncEngine._find_git_root(str(doc)) == tmp_path.resolve()
+
+
+class _FakeDocuments:
+    def get(self, document_id: str) -> SimpleNamespace:
+        return SimpleNamespace(
+            document_id=document_id, title=document_id, revision_id=1
+        )
+
+
+class _FakeBlocks:
+    def __init__(self) -> None:
+        self.listings: list[str] = []
+        self._lock = threading.Lock()
+
+    def iter_all_blocks(self, document_id: str) -> Iterator[Any]:
+        with self._lock:
+            self.listings.append(document_id)
+        return iter(())
+
+    def last_revision(self, document_id: str) -> int | None:
+        return None
+
+
+class _FakeToMarkdown:
+    def convert(self, blocks: list[dict[str, Any]]) -> str:
+        return "# Doc\n"
+
+
+def test_sync_all_from_lark_lists_each_document_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Prefetched Markdown is handed to the pull, even past the cache size."""
+    monkeypatch.chdir(tmp_path)
+    blocks = _FakeBlocks()
+    client = SimpleNamespace(documents=_FakeDocuments(), blocks=blocks)
+    engine = SyncEngine(
+        client,
+        SyncStateManager(str(tmp_path / "state.json")),
+        _FakeToMarkdown(),
+        None,
+    )
+    document_ids = [f"doc{i}" for i in range(2 * SyncEngine._MD_CACHE_SIZE)]
+
+    results = engine.sync_all_from_lark(document_ids, force=True)
+
+    assert all(r.success for r in results)
+    assert sorted(blocks.listings) == sorted(document_ids)
+
+
+def test_prefetch_resolves_mappings_on_calling_thread(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Pool workers never read sync state; up-to-date documents are skipped."""
+    monkeypatch.chdir(tmp_path)
+    blocks = _FakeBlocks()
+    client = SimpleNamespace(documents=_FakeDocuments(), blocks=blocks)
+    state = SyncStateManager(str(tmp_path / "state.json"))
+    state.add_mapping(
+        SyncMapping(
+            local_path=str(tmp_path / "synced.md"),
+            lark_document_id="synced",
+            remote_revision_at_sync=1,
+        )
+    )
+    engine = SyncEngine(client, state, _FakeToMarkdown(), None)
+
+    caller = threading.get_ident()
+    lookup_threads: list[int] = []
+    find_mapping = engine._find_mapping_by_doc_id
+
+    def recording_find(document_id: str) -> Any:
+        lookup_threads.append(threading.get_ident())
+        return find_mapping(document_id)
+
+    monkeypatch.setattr(engine, "_find_mapping_by_doc_id", recording_find)
+
+    futures = engine.prefetch_pulls(["synced", "new"])
+    results = [engine.prefetch_result(f) for f in futures]
+
+    assert set(lookup_threads) == {caller}
+    assert results == [None, (1, "# Doc\n")]
+    assert blocks.listings == ["new"]
+
+
+class _FakeWriteBlocks:
+    """Blocks client whose last created block lists as a 2x2 table."""
+
+    def __init__(self) -> None:
+        self._created = 0
+        self.create_calls = 0
+        self.deleted: list[tuple[int, int]] = []
+
+    def get_block(self, document_id: str, block_id: str) -> SimpleNamespace:
+        return SimpleNamespace(block_id=block_id, children=["root_child"])
+
+    def batch_delete(
+        self, document_id: str, block_id: str, start: int, end: int
+    ) -> None:
+        self.deleted.append((start, end))
+
+    def create_children(
+        self,
+        document_id: str,
+        block_id: str,
+        children: list[dict[str, Any]],
+        *,
+        index: int | None = None,
+    ) -> list[SimpleNamespace]:
+        self.create_calls += 1
+        created = []
+        for _ in children:
+            self._created += 1
+            created.append(SimpleNamespace(block_id=f"b{self._created}"))
+        return created
+
+    def iter_all_blocks(self, document_id: str) -> Iterator[SimpleNamespace]:
+        table_id = f"b{self._created}"
+        cells = [f"{table_id}_c{i}" for i in range(4)]
+        yield SimpleNamespace(block_id=table_id, parent_id="", children=cells)
+        for cell in cells:
+            yield SimpleNamespace(
+                block_id=cell, parent_id=table_id, children=[f"{cell}_t"]
+            )
+
+    def forget_revision(self, document_id: str) -> None:
+        pass
+
+    def record_revision(self, document_id: str, response: Any) -> None:
+        pass
+
+    def last_revision(self, document_id: str) -> int | None:
+        return None
+
+    def revision_unknown(self, document_id: str) -> bool:
+        return False
+
+
+def test_replace_document_content_clears_unless_told_not_to(
+    tmp_path: Path,
+) -> None:
+    """A new document is filled without first listing and deleting."""
+    blocks = _FakeWriteBlocks()
+    engine = SyncEngine(
+        SimpleNamespace(blocks=blocks),
+        SyncStateManager(str(tmp_path / "state.json")),
+        None,
+        None,
+    )
+    paragraph = {"block_type": 2, "text": {"elements": []}}
+
+    engine.replace_document_content("new", [paragraph], clear=False)
+    assert blocks.deleted == []
+    assert blocks.create_calls == 1
+
+    engine.replace_document_content("old", [paragraph])
+    assert blocks.deleted == [(0, 1)]
+    assert blocks.create_calls == 2
+
+
+def _failed_batch_update(request: Any) -> SimpleNamespace:
+    return SimpleNamespace(success=lambda: False, code=1, msg="boom")
+
+
+def test_push_with_failed_table_fill_is_rewritten_by_next_push(
+    tmp_path: Path,
+) -> None:
+    """A logged cell-fill failure fails the push and forces a full rewrite."""
+    from lark_sync.converter import MarkdownToLarkConverter
+
+    doc = tmp_path / "table.md"
+    doc.write_text("| a | b |\n|---|---|\n| 1 | 2 |\n", encoding="utf-8")
+    documents = SimpleNamespace(
+        create=lambda title, folder: SimpleNamespace(
+            document_id="doc", title=title, revision_id=1
+        ),
+        get=lambda document_id: SimpleNamespace(
+            document_id=document_id, title="Table", revision_id=1
+        ),
+    )
+    raw = SimpleNamespace(
+        docx=SimpleNamespace(
+            v1=SimpleNamespace(
+                document_block=SimpleNamespace(batch_update=_failed_batch_update)
+            )
+        )
+    )
+    blocks = _FakeWriteBlocks()
+    client = SimpleNamespace(documents=documents, blocks=blocks, raw=raw)
+    state = SyncStateManager(str(tmp_path / "state.json"))
+    engine = SyncEngine(client, state, None, MarkdownToLarkConverter())
+
+    result = engine.sync_to_lark(str(doc))
+
+    assert not result.success
+    mapping = state.get_mapping(str(doc))
+    assert mapping is not None
+    assert mapping.block_hashes == []
+    assert mapping.local_hash_at_sync == ""
+
+    # The unchanged file is pushed again: it must be rewritten, not skipped.
+    blocks.create_calls = 0
+    engine.sync_to_lark(str(doc))
+
+    assert blocks.deleted == [(0, 1)]
+    assert blocks.create_calls > 0
+
+
+def _push_client(
+    blocks: _FakeWriteBlocks, revision: dict[str, int]
+) -> SimpleNamespace:
+    documents = SimpleNamespace(
+        create=lambda title, folder: SimpleNamespace(
+            document_id="doc", title=title, revision_id=revision["doc"]
+        ),
+        get=lambda document_id: SimpleNamespace(
+            document_id=document_id, title="Doc", revision_id=revision["doc"]
+        ),
+    )
+    return SimpleNamespace(documents=documents, blocks=blocks)
+
+
+def test_push_of_unchanged_file_restores_remote_edits(tmp_path: Path) -> None:
+    """The unchanged-file skip applies only while the remote is unchanged."""
+    from lark_sync.converter import MarkdownToLarkConverter
+
+    doc = tmp_path / "doc.md"
+    doc.write_text("# Title\n\nBody\n", encoding="utf-8")
+    blocks = _FakeWriteBlocks()
+    revision = {"doc": 1}
+    state = SyncStateManager(str(tmp_path / "state.json"))
+    engine = SyncEngine(
+        _push_client(blocks, revision), state, None, MarkdownToLarkConverter()
+    )
+    assert engine.sync_to_lark(str(doc)).success
+
+    blocks.create_calls = 0
+    skipped = engine.sync_to_lark(str(doc))
+    assert "skipped" in skipped.message
+    assert blocks.create_calls == 0
+
+    revision["doc"] = 2  # Edited in Lark.
+    pushed = engine.sync_to_lark(str(doc))
+    assert pushed.success
+    assert "skipped" not in pushed.message
+    assert blocks.create_calls > 0
+
+
+class _FailingToLark:
+    def convert(self, markdown_text: str) -> list[dict[str, Any]]:
+        raise ValueError("unsupported Markdown")
+
+
+def test_push_conversion_error_leaves_remote_untouched(tmp_path: Path) -> None:
+    """Conversion finishes before any document is created or cleared."""
+    doc = tmp_path / "doc.md"
+    doc.write_text("# Title\n", encoding="utf-8")
+    created: list[str] = []
+    documents = SimpleNamespace(
+        create=lambda title, folder: created.append(title),
+    )
+    blocks = _FakeWriteBlocks()
+    engine = SyncEngine(
+        SimpleNamespace(documents=documents, blocks=blocks),
+        SyncStateManager(str(tmp_path / "state.json")),
+        None,
+        _FailingToLark(),
+    )
+
+    with pytest.raises(ValueError):
+        engine.sync_to_lark(str(doc))
+    with pytest.raises(ValueError):
+        engine.sync_to_lark(str(doc), document_id="existing", force=True)
+
+    assert created == []
+    assert blocks.deleted == []
+    assert blocks.create_calls == 0
+
+
+def test_unpolled_finished_jobs_expire(tmp_path: Path) -> None:
+    """Finished jobs nobody polls are dropped after ``_JOB_TTL``."""
+    engine = SyncEngine(
+        SimpleNamespace(),
+        SyncStateManager(str(tmp_path / "state.json")),
+        None,
+        None,
+    )
+    first = engine.submit_job(lambda: "first")
+    engine._jobs[first].result()
+    assert first in engine._job_finished
+
+    engine._JOB_TTL = 0.0
+    second = engine.submit_job(lambda: "second")
+
+    assert engine.job_status(first) == {"job_id": first, "status": "unknown"}
+    assert first not in engine._job_finished
+    assert second in engine._jobs
+
+
+class _RecordingBlocks(_FakeWriteBlocks):
+    """Blocks client logging root-level deletes and creates in order."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.root_children = 0
+        self.ops: list[tuple[str, int | None, int]] = []
+
+    def get_block(self, document_id: str, block_id: str) -> SimpleNamespace:
+        children = [f"child{i}" for i in range(self.root_children)]
+        return SimpleNamespace(block_id=block_id, children=children)
+
+    def batch_delete(
+        self, document_id: str, block_id: str, start: int, end: int
+    ) -> None:
+        self.ops.append(("delete", start, end))
+
+    def create_children(
+        self,
+        document_id: str,
+        block_id: str,
+        children: list[dict[str, Any]],
+        *,
+        index: int | None = None,
+    ) -> list[SimpleNamespace]:
+        self.ops.append(("create", index, len(children)))
+        return super().create_children(
+            document_id, block_id, children, index=index
+        )
+
+
+def _pushed_paragraphs(
+    tmp_path: Path, paragraphs: list[str]
+) -> tuple[SyncEngine, _RecordingBlocks, Path]:
+    """Push *paragraphs* once and return the engine, blocks and file."""
+    from lark_sync.converter import MarkdownToLarkConverter
+
+    doc = tmp_path / "doc.md"
+    doc.write_text("\n\n".join(paragraphs) + "\n", encoding="utf-8")
+    blocks = _RecordingBlocks()
+    engine = SyncEngine(
+        _push_client(blocks, {"doc": 1}),
+        SyncStateManager(str(tmp_path / "state.json")),
+        None,
+        MarkdownToLarkConverter(),
+    )
+    assert engine.sync_to_lark(str(doc)).success
+    blocks.root_children = len(paragraphs)
+    blocks.ops.clear()
+    return engine, blocks, doc
+
+
+def test_incremental_push_applies_edits_back_to_front(tmp_path: Path) -> None:
+    """Changed blocks are rewritten from the end so indices stay valid."""
+    engine, blocks, doc = _pushed_paragraphs(tmp_path, ["A", "B", "C"])
+
+    doc.write_text("A\n\nX\n\nC\n\nD\n", encoding="utf-8")
+    assert engine.sync_to_lark(str(doc)).success
+
+    assert blocks.ops == [
+        ("create", 3, 1),  # insert D after C
+        ("delete", 1, 2),  # replace B ...
+        ("create", 1, 1),  # ... with X
+    ]
+
+    blocks.root_children = 4
+    blocks.ops.clear()
+    doc.write_text("A\n\nX\n\nD\n", encoding="utf-8")
+    assert engine.sync_to_lark(str(doc)).success
+
+    assert blocks.ops == [("delete", 2, 3)]
+
+
+def test_incremental_push_rewrites_when_child_count_differs(
+    tmp_path: Path,
+) -> None:
+    """A root child count that disagrees with the hashes forces a rewrite."""
+    engine, blocks, doc = _pushed_paragraphs(tmp_path, ["A", "B", "C"])
+    blocks.root_children = 4
+
+    doc.write_text("A\n\nX\n\nC\n", encoding="utf-8")
+    assert engine.sync_to_lark(str(doc)).success
+
+    assert blocks.ops == [("delete", 0, 4), ("create", None, 3)]
@@ -0,0 +1,122 @@
+"""Tests for ``lark_sync.sync.state``."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from lark_sync.sync.state import SyncMapping, SyncStateManager
+
+
+def _mapping(local_path: str, document_id: str) -> SyncMapping:
+    return SyncMapping(local_path=local_path, lark_document_id=document_id)
+
+
+def test_load_inside_batch_keeps_unsaved_mappings(tmp_path: Path) -> None:
+    """A load() inside batch() must not drop mappings not yet written."""
+    state_file = tmp_path / "state.json"
+    manager = SyncStateManager(str(state_file))
+
+    with manager.batch():
+        manager.add_mapping(_mapping("/docs/a.md", "doc_a"))
+        state = manager.load()
+        assert [m.lark_document_id for m in state.mappings] == ["doc_a"]
+
+    saved = json.loads(state_file.read_text(encoding="utf-8"))
+    assert [m["lark_document_id"] for m in saved["mappings"]] == ["doc_a"]
+
+
+def test_load_inside_batch_ignores_concurrent_file_change(
+    tmp_path: Path,
+) -> None:
+    """A file rewritten mid-batch does not replace pending changes."""
+    state_file = tmp_path / "state.json"
+    manager = SyncStateManager(str(state_file))
+    manager.add_mapping(_mapping("/docs/a.md", "doc_a"))
+
+    with manager.batch():
+        manager.add_mapping(_mapping("/docs/b.md", "doc_b"))
+        state_file.write_text('{"version": 1, "mappings": []}\n')
+        manager.load(validate=False)
+
+    saved = json.loads(state_file.read_text(encoding="utf-8"))
+    assert sorted(m["lark_document_id"] for m in saved["mappings"]) == [
+        "doc_a",
+        "doc_b",
+    ]
+
+
+def test_project_state_keeps_machine_fields_in_cache(tmp_path: Path) -> None:
+    """Block hashes and stat fingerprints stay out of the committed file."""
+    state_file = tmp_path / ".lark-sync.json"
+    cache_file = tmp_path / "cache" / "state.json"
+    manager = SyncStateManager(
+        str(state_file), project_root=tmp_path, cache_file=str(cache_file)
+    )
+    mapping = _mapping(str(tmp_path / "docs" / "a.md"), "doc_a")
+    mapping.remote_revision_at_sync = 3
+    mapping.block_hashes = ["h1", "h2"]
+    mapping.local_mtime_ns = 123
+    mapping.local_size = 45
+    manager.add_mapping(mapping)
+
+    saved = json.loads(state_file.read_text(encoding="utf-8"))["mappings"][0]
+    assert saved["local_path"] == "docs/a.md"
+    assert not {"block_hashes", "local_mtime_ns", "local_size"} & saved.keys()
+
+    reloaded = SyncStateManager(
+        str(state_file), project_root=tmp_path, cache_file=str(cache_file)
+    ).get_mapping("docs/a.md")
+    assert reloaded is not None
+    assert reloaded.block_hashes == ["h1", "h2"]
+    assert (reloaded.local_mtime_ns, reloaded.local_size) == (123, 45)
+
+
+def test_project_state_ignores_cache_for_another_revision(
+    tmp_path: Path,
+) -> None:
+    """Cached block hashes from an older sync are not applied."""
+    state_file = tmp_path / ".lark-sync.json"
+    cache_file = tmp_path / "cache.json"
+    manager = SyncStateManager(
+        str(state_file), project_root=tmp_path, cache_file=str(cache_file)
+    )
+    mapping = _mapping("docs/a.md", "doc_a")
+    mapping.block_hashes = ["h1"]
+    manager.add_mapping(mapping)
+
+    # Another machine pushed and its state file was pulled.
+    data = json.loads(state_file.read_text(encoding="utf-8"))
+    data["mappings"][0]["remote_revision_at_sync"] = 9
+    state_file.write_text(json.dumps(data), encoding="utf-8")
+
+    reloaded = SyncStateManager(
+        str(state_file), project_root=tmp_path, cache_file=str(cache_file)
+    ).get_mapping("docs/a.md")
+    assert reloaded is not None
+    assert reloaded.block_hashes == []
+
+
+def test_mapping_helpers_keep_indices_current(tmp_path: Path) -> None:
+    """Lookups stay correct without reindexing after each mutation."""
+    manager = SyncStateManager(str(tmp_path / "state.json"))
+    first = _mapping("/docs/a.md", "doc_shared")
+    second = _mapping("/docs/b.md", "doc_shared")
+
+    with manager.batch():
+        manager.add_mapping(first)
+        manager.add_mapping(second)
+        assert manager.get_mapping_by_doc_id("doc_shared") is first
+
+        manager.remove_mapping("/docs/a.md")
+        assert manager.get_mapping("/docs/a.md") is None
+        assert manager.get_mapping_by_doc_id("doc_shared") is second
+
+        manager.update_mapping("/docs/b.md", lark_document_id="doc_b")
+        assert manager.get_mapping_by_doc_id("doc_shared") is None
+        assert manager.get_mapping_by_doc_id("doc_b") is second
+
+        replacement = _mapping("/docs/b.md", "doc_c")
+        manager.add_mapping(replacement)
+        assert manager.get_mapping_by_doc_id("doc_b") is None
+        assert manager.get_mapping("/docs/b.md") is replacement
@@ -0,0 +1,146 @@
+"""Tests for the MCP tools in ``lark_sync.tools``."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from mcp.server.fastmcp import FastMCP
+
+from lark_sync.sync.engine import SyncEngine
+from lark_sync.sync.state import SyncStateManager
+from lark_sync.tools.sync_tools import register_sync_tools
+from lark_sync.tools.write_tools import register_write_tools
+
+
+class _LockedEngine:
+    """Engine stub whose pushes wait on ``operation_lock``."""
+
+    def __init__(self) -> None:
+        self.operation_lock = threading.Lock()
+
+    def sync_to_lark(self, **kwargs: Any) -> SimpleNamespace:
+        with self.operation_lock:
+            return SimpleNamespace(to_dict=lambda: {"success": True})
+
+    def job_status(self, job_id: str) -> dict[str, Any]:
+        return {"job_id": job_id, "status": "unknown"}
+
+
+async def test_foreground_push_waits_for_lock_off_the_event_loop() -> None:
+    """A push blocked behind a background job leaves polling responsive."""
+    engine = _LockedEngine()
+    mcp = FastMCP("test")
+    register_write_tools(mcp, SimpleNamespace(), engine)  # type: ignore[arg-type]
+    register_sync_tools(mcp, engine)  # type: ignore[arg-type]
+
+    engine.operation_lock.acquire()
+    try:
+        push = asyncio.create_task(
+            mcp.call_tool("sync_to_lark", {"local_path": "doc.md"})
+        )
+        _, poll = await asyncio.wait_for(
+            mcp.call_tool("poll_sync_job", {"job_id": "job"}), timeout=5
+        )
+        assert poll == {"job_id": "job", "status": "unknown"}
+        assert not push.done()
+    finally:
+        engine.operation_lock.release()
+
+    _, result = await asyncio.wait_for(push, timeout=5)
+    assert result == {"success": True}
+
+
+class _WriteEngine:
+    """Engine stub exposing only the public API ``write_document`` uses."""
+
+    def __init__(self) -> None:
+        self.titles: dict[str, str] = {}
+        self.writes: list[tuple[str, int, bool]] = []
+
+    def prefetch_title(self, document_id: str) -> None:
+        self.titles.setdefault(document_id, "Existing")
+
+    def get_cached_title(self, document_id: str) -> str | None:
+        return self.titles.get(document_id)
+
+    def record_title(self, document_id: str, title: str) -> None:
+        self.titles[document_id] = title
+
+    def replace_document_content(
+        self, document_id: str, blocks: list[dict[str, Any]], clear: bool = True
+    ) -> None:
+        self.writes.append((document_id, len(blocks), clear))
+
+
+async def test_write_document_uses_public_engine_api() -> None:
+    """Creating skips the clear; updating replaces content in place."""
+    engine = _WriteEngine()
+    documents = SimpleNamespace(
+        create=lambda title, folder: SimpleNamespace(
+            document_id="new", title=title
+        )
+    )
+    mcp = FastMCP("test")
+    register_write_tools(
+        mcp, SimpleNamespace(documents=documents), engine  # type: ignore[arg-type]
+    )
+
+    _, created = await mcp.call_tool(
+        "write_document", {"content": "# A\n", "title": "Notes"}
+    )
+    _, updated = await mcp.call_tool(
+        "write_document", {"content": "# B\n", "document_id": "old"}
+    )
+
+    assert created == {"document_id": "new", "title": "Notes", "action": "created"}
+    assert updated == {
+        "document_id": "old",
+        "title": "Existing",
+        "action": "updated",
+    }
+    assert engine.writes == [("new", 1, False), ("old", 1, True)]
+
+
+async def test_sync_batch_prefetches_pulls_within_window(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Each pulled document is fetched once, however small the window."""
+    monkeypatch.chdir(tmp_path)
+    listings: list[str] = []
+    documents = SimpleNamespace(
+        get=lambda document_id: SimpleNamespace(
+            document_id=document_id, title=document_id, revision_id=1
+        )
+    )
+    blocks = SimpleNamespace(
+        iter_all_blocks=lambda document_id: listings.append(document_id) or [],
+        last_revision=lambda document_id: None,
+    )
+    engine = SyncEngine(
+        SimpleNamespace(documents=documents, blocks=blocks),
+        SyncStateManager(str(tmp_path / "state.json")),
+        SimpleNamespace(convert=lambda blocks: "# Doc\n"),
+        None,
+    )
+    engine.PREFETCH_WINDOW = 1
+    mcp = FastMCP("test")
+    register_sync_tools(mcp, engine)
+    document_ids = [f"doc{i}" for i in range(4)]
+
+    _, result = await mcp.call_tool(
+        "sync_batch",
+        {
+            "operations": [
+                {"action": "pull", "document_id": doc_id, "force": True}
+                for doc_id in document_ids
+            ]
+        },
+    )
+
+    assert [r["success"] for r in result["result"]] == [True] * 4
+    assert sorted(listings) == document_ids